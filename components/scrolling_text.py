@@ -1,6 +1,6 @@
 import pygame
 from core.constants import FRAME_RATE
-from core.utils.pygame_utils import blit_with_shadow
+from core.utils.pygame_utils import SHADOW_OFFSET, get_shadow
 
 class ScrollingText:
     def __init__(self, text_surface, max_width, speed=1):
@@ -11,6 +11,8 @@ class ScrollingText:
         self.offset = 0
         self.direction = 1  # 1: left, -1: right
         self.should_scroll = self.text_surface.get_width() > self.max_width  # Scroll only if necessary
+        # Shadow of the full text, built once; cropped together with it on every scrolling frame
+        self.shadow_surface = get_shadow(self.text_surface)
 
     def update(self):
         """Updates text scrolling only if required, frame-rate independent."""
@@ -29,16 +31,15 @@ class ScrollingText:
     def draw(self, surface, position):
         """Draws scrolling text or static text if it fits."""
         if not self.should_scroll:
-            # If text fits, render normally
-            blit_with_shadow(surface, self.text_surface, position)
+            # If text fits, draw it with its prebuilt shadow (no per-frame shadow lookup)
+            surface.blit(self.shadow_surface, (position[0] + SHADOW_OFFSET[0], position[1] + SHADOW_OFFSET[1]))
+            surface.blit(self.text_surface, position)
         else:
             # Scroll text using clamped rect
             rect = pygame.Rect(int(self.offset), 0, self.max_width, self.text_surface.get_height())
             if rect.right > self.text_surface.get_width():
                 rect.width = self.text_surface.get_width() - rect.left
 
-            visible_surface = pygame.Surface((self.max_width, self.text_surface.get_height()), pygame.SRCALPHA)
-            visible_surface.blit(self.text_surface, (0, 0), rect)
-
-            # Draw the visible surface with shadow
-            blit_with_shadow(surface, visible_surface, position)
\ No newline at end of file
+            # Blit only the visible strip of the text and its shadow, no per-frame surface
+            surface.blit(self.shadow_surface, (position[0] + SHADOW_OFFSET[0], position[1] + SHADOW_OFFSET[1]), rect)
+            surface.blit(self.text_surface, position, rect)
\ No newline at end of file
@@ -1,45 +1,109 @@
+from operator import attrgetter
+
 import pygame
 
 from components.scrolling_text import ScrollingText
 from core import runtime_globals
 from core.constants import *
 from core.utils.module_utils import get_module
-from core.utils.pygame_utils import blit_with_cache, blit_with_shadow, get_font, sprite_load_percent
+from core.utils.pygame_utils import SHADOW_OFFSET, bake_shadow, blit_batch, blit_with_cache, get_font, render_shadowed, render_text, sprite_load_percent
 
 
 PAGE_MARGIN = int(16 * UI_SCALE)
 
+# Layout constants, computed once at import instead of on every page build
+FONT_LARGE_SIZE = int(40 * UI_SCALE)
+FONT_SMALL_SIZE = int(30 * UI_SCALE)
+LINE_SPACING = int(30 * UI_SCALE)
+ROW_DISTANCE = int(37 * UI_SCALE)
+RIGHT_ALIGN_X = int(SCREEN_WIDTH - (20 * UI_SCALE))
+HEARTS_X = int(SCREEN_WIDTH - (110 * UI_SCALE))
+ICON_X = int(10 * UI_SCALE)
+LABEL_X = int(40 * UI_SCALE)
+NAME_X = int(75 * UI_SCALE)
+STAGE_X = int(139 * UI_SCALE)
+NAME_MAX_WIDTH = int(162 * UI_SCALE)
+STAGE_MAX_WIDTH = int(98 * UI_SCALE)
+ICON_Y_OFFSET = int(5 * UI_SCALE)
+LEVEL_ICON_Y_OFFSET = int(2 * UI_SCALE)
+LEVEL_ICON_SPACING = int(40 * UI_SCALE)
+STAT_ICON_SPACING = int(80 * UI_SCALE)
+STAT_VALUE_OFFSET = int(32 * UI_SCALE)
+FLAGS_X = PAGE_MARGIN + int(70 * UI_SCALE)
+ICON_SPACING = int(24 * UI_SCALE)
+BLOCK_SPACING = int(2 * UI_SCALE)
+ENERGY_BAR_BLOCKS = 13
+SCROLLING_CACHE_SIZE = 32
+
+# Row Y positions for the 37px-spaced pages (2-4) and the 30px-spaced page 1
+ROW_YS = tuple(PAGE_MARGIN + ROW_DISTANCE * i for i in range(7))
+LINE_YS = tuple(PAGE_MARGIN + LINE_SPACING * i for i in range(7))
+DIVIDER_Y = PAGE_MARGIN + PET_ICON_SIZE + LINE_SPACING
+# "HH:MM" strings for every minute of a day, indexed by total minutes
+_HHMM = tuple(f"{m // 60:02}:{m % 60:02}" for m in range(24 * 60))
+
+# Pet attributes the pages show, directly or through can_battle()/get_power(); the page cache
+# is keyed on their values, plus condition hearts, the dead flag and the timer in whole minutes
+STATUS_FIELDS = (
+    "name", "stage", "age", "weight", "module", "version", "special", "traited", "shiny", "shook",
+    "hunger", "strength", "effort", "dp", "energy", "power", "atk_main", "level", "experience",
+    "mistakes", "sleep_disturbances", "overfeed", "injuries", "jogress_avaliable",
+    "battles", "totalBattles", "win", "totalWin", "time", "evolve", "sleeps", "wakes",
+    "poop_timer", "hunger_loss",
+)
+_status_values = attrgetter(*STATUS_FIELDS)
+STATUS_MINUTE_TICKS = FRAME_RATE * 60
+
+def status_key(pet) -> tuple:
+    """Returns the values a pet's status pages are drawn from."""
+    try:
+        values = _status_values(pet)
+    except AttributeError:
+        # A field the pet was never given; the pages treat it as unset
+        values = tuple(getattr(pet, name, None) for name in STATUS_FIELDS)
+    # condition_hearts only exists on pets whose module uses them
+    return (values, getattr(pet, "condition_hearts", 0), pet.state == "dead",
+            pet.timer // STATUS_MINUTE_TICKS)
+
+def format_seconds(seconds: int) -> str:
+    """Formats a countdown in seconds as HH:MM, or 00:00 once it has run out."""
+    if seconds > 0:
+        minutes = seconds // 60
+        if minutes < 24 * 60:
+            return _HHMM[minutes]
+        return f"{minutes // 60:02}:{minutes % 60:02}"
+    return "00:00"
+
+
 class WindowStatus:
     """Handles the detailed pet status pages with optimized performance and caching."""
 
+    # (id(pet), name, stage) -> (scrolling_name, scrolling_stage), shared by all windows, oldest first
+    _scrolling_cache = {}
+
     def __init__(self, pet):
         """Initialize pet data and pre-load sprites."""
         self.pet = pet
-        scale = UI_SCALE
-        self.font_large = get_font(int(40 * UI_SCALE))
-        self.font_small = get_font(int(30 * UI_SCALE))
-        self.right_align_x = int(SCREEN_WIDTH - (20 * scale))
-
-        self.scrolling_name = ScrollingText(
-                self.font_large.render(self.pet.name, True, FONT_COLOR_DEFAULT),
-                max_width=int((162 * UI_SCALE)),
-                speed=1
-            )
-        self.scrolling_stage = ScrollingText(
-            self.font_small.render(f"{STAGES[self.pet.stage]}", True, FONT_COLOR_DEFAULT),
-            max_width=int((98 * UI_SCALE)),
-            speed=1
-        )
+        self.font_large = get_font(FONT_LARGE_SIZE)
+        self.font_small = get_font(FONT_SMALL_SIZE)
+        self.right_align_x = RIGHT_ALIGN_X
+
+        self.scrolling_name, self.scrolling_stage = self.get_scrolling_texts(pet)
 
         # Pre-scale pet sprite
-        self.pet_sprite = pygame.transform.scale(runtime_globals.pet_sprites[pet][0], (PET_ICON_SIZE, PET_ICON_SIZE))
+        self.pet_sprite = self.get_pet_icon(pet)
 
         # Pre-load sprites once
         self.sprites = self.load_sprites()
+        self.sprites_shadowed = {key: bake_shadow(sprite).convert_alpha() for key, sprite in self.sprites.items()}
+        self._heart_rows = self.build_heart_rows()
+        self._energy_offsets = self.build_energy_offsets()
+        self._pages = (None, self.draw_page_1, self.draw_page_2, self.draw_page_3, self.draw_page_4)
 
-        # Caching
+        # Caching; the page surface is allocated on first use and refilled on every rebuild
+        self._page_surface = None
         self._last_cache = None
-        self._last_cache_key = None
+        self._last_key = None
 
     @classmethod
     def load_sprites(cls):
@@ -60,42 +124,72 @@ class WindowStatus:
             for key, path in sprite_paths.items()
         }
 
+    def get_scrolling_texts(self, pet):
+        """
+        Returns the (name, stage) ScrollingText pair for a pet, reusing it when the
+        pet is viewed again with the same name and stage. Scrolling restarts on reuse.
+        """
+        cache = WindowStatus._scrolling_cache
+        key = (id(pet), pet.name, pet.stage)
+        texts = cache.pop(key, None)
+        if texts is None:
+            texts = (
+                ScrollingText(render_text(self.font_large, pet.name, FONT_COLOR_DEFAULT), max_width=NAME_MAX_WIDTH, speed=1),
+                ScrollingText(render_text(self.font_small, f"{STAGES[pet.stage]}", FONT_COLOR_DEFAULT), max_width=STAGE_MAX_WIDTH, speed=1),
+            )
+            if len(cache) >= SCROLLING_CACHE_SIZE:
+                cache.pop(next(iter(cache)))  # Drop the least recently used pair
+        else:
+            for text in texts:
+                text.offset = 0
+                text.direction = 1
+        cache[key] = texts
+        return texts
+
+    @staticmethod
+    def get_pet_icon(pet):
+        """
+        Returns the pet's first frame scaled to PET_ICON_SIZE with its shadow baked in, cached in runtime_globals.
+        The cache entry is rebuilt when the source frame is replaced (reload or death).
+        """
+        key = (pet, PET_ICON_SIZE)
+        source = runtime_globals.pet_sprites[pet][0]
+        cached = runtime_globals.pet_sprites_scaled.get(key)
+        if cached is None or cached[0] is not source:
+            scaled = pygame.transform.scale(source, (PET_ICON_SIZE, PET_ICON_SIZE))
+            cached = (source, bake_shadow(scaled).convert_alpha())
+            runtime_globals.pet_sprites_scaled[key] = cached
+        return cached[1]
+
     def set_pet(self, pet):
         """Call this when the viewed pet changes."""
         self.pet = pet
-        self.scrolling_name = ScrollingText(
-            self.font_large.render(self.pet.name, True, FONT_COLOR_DEFAULT),
-            max_width=int((162 * UI_SCALE)),
-            speed=1
-        )
-        self.scrolling_stage = ScrollingText(
-            self.font_small.render(f"{STAGES[self.pet.stage]}", True, FONT_COLOR_DEFAULT),
-            max_width=int((98 * UI_SCALE)),
-            speed=1
-        )
-        self.pet_sprite = pygame.transform.scale(runtime_globals.pet_sprites[pet][0], (PET_ICON_SIZE, PET_ICON_SIZE))
+        self.scrolling_name, self.scrolling_stage = self.get_scrolling_texts(pet)
+        self.pet_sprite = self.get_pet_icon(pet)
         self._last_cache = None
-        self._last_cache_key = None
+        self._last_key = None
+
+    def _right_x(self, shadowed):
+        """X position that right-aligns a shadow-baked text surface at right_align_x."""
+        return self.right_align_x - (shadowed.get_width() - SHADOW_OFFSET[0])
 
     def draw_page(self, surface, page_number):
         """Draws the requested page, using cache if possible.
+        The cache is rebuilt when the page changes or any value in status_key() does.
         On page 1, scrolling name and stage are always updated and redrawn every frame.
         """
-        cache_key = (
-            id(self.pet),  # Unique per pet object
-            page_number,
-            UI_SCALE,
-            SCREEN_WIDTH,
-            SCREEN_HEIGHT
-        )
-        if self._last_cache_key != cache_key or self._last_cache is None:
+        key = (page_number, status_key(self.pet))
+        if self._last_key != key:
             # Redraw and cache
-            page_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-            draw_methods = {1: self.draw_page_1, 2: self.draw_page_2, 3: self.draw_page_3, 4: self.draw_page_4}
-            if page_number in draw_methods:
-                draw_methods[page_number](page_surface)
+            page_surface = self._page_surface
+            if page_surface is None:
+                page_surface = self._page_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA).convert_alpha()
+            else:
+                page_surface.fill((0, 0, 0, 0))
+            if 0 < page_number < len(self._pages):
+                self._pages[page_number](page_surface)
             self._last_cache = page_surface
-            self._last_cache_key = cache_key
+            self._last_key = key
 
         # Blit cached static content
         #surface.blit(self._last_cache, (0, 0))
@@ -103,124 +197,133 @@ class WindowStatus:
 
         # On page 1, always update and redraw scrolling name and stage
         if page_number == 1:
-            spacing = int(30 * UI_SCALE)
-            self.scrolling_name.update()
-            self.scrolling_name.draw(surface, (int(75 * UI_SCALE), PAGE_MARGIN))
-            self.scrolling_stage.update()
-            self.scrolling_stage.draw(surface, (int(139 * UI_SCALE), PAGE_MARGIN + spacing))
+            # Text that fits has nothing to scroll, so only the draw is needed
+            if self.scrolling_name.should_scroll:
+                self.scrolling_name.update()
+            self.scrolling_name.draw(surface, (NAME_X, LINE_YS[0]))
+            if self.scrolling_stage.should_scroll:
+                self.scrolling_stage.update()
+            self.scrolling_stage.draw(surface, (STAGE_X, LINE_YS[1]))
 
     def draw_page_1(self, surface: pygame.Surface) -> None:
         """Draws page 1: Basic pet info (name, stage, age, weight, module, version)."""
-        spacing = int(30 * UI_SCALE)
-        blit_with_shadow(surface, self.pet_sprite, (PAGE_MARGIN, PAGE_MARGIN))
+        blits = []
+        blits.append((self.pet_sprite, (PAGE_MARGIN, PAGE_MARGIN)))
 
         #self.scrolling_name.update()
         #self.scrolling_name.draw(surface, (int(75 * UI_SCALE), PAGE_MARGIN))
 
-        blit_with_shadow(surface, self.font_small.render(f"Stage:", True, FONT_COLOR_DEFAULT), (int(75 * UI_SCALE), PAGE_MARGIN + spacing))
+        blits.append((render_shadowed(self.font_small, f"Stage:", FONT_COLOR_DEFAULT), (NAME_X, LINE_YS[1])))
         #self.scrolling_stage.update()
         #self.scrolling_stage.draw(surface, (int(139 * UI_SCALE), PAGE_MARGIN + spacing))
         
-        pygame.draw.line(surface, FONT_COLOR_DEFAULT, (0, PAGE_MARGIN + PET_ICON_SIZE + spacing), (SCREEN_WIDTH, PAGE_MARGIN + PET_ICON_SIZE + spacing), 2)
+        pygame.draw.line(surface, FONT_COLOR_DEFAULT, (0, DIVIDER_Y), (SCREEN_WIDTH, DIVIDER_Y), 2)
 
         # Icons and labels
         labels = ["age", "weight", "module", "version"]
         values = [f"{self.pet.age}A", f"{self.pet.weight}g", self.pet.module, f"Ver.{self.pet.version}"]
 
         for i, label in enumerate(labels):
-            y_pos = PAGE_MARGIN + (spacing * 3) + i * spacing
-            blit_with_shadow(surface, self.sprites[label], (int(10 * UI_SCALE), y_pos))
-            blit_with_shadow(surface, self.font_small.render(f"{label.capitalize()}:", True, FONT_COLOR_DEFAULT), (int(40 * UI_SCALE), y_pos))
+            y_pos = LINE_YS[3 + i]
+            blits.append((self.sprites_shadowed[label], (ICON_X, y_pos)))
+            blits.append((render_shadowed(self.font_small, f"{label.capitalize()}:", FONT_COLOR_DEFAULT), (LABEL_X, y_pos)))
+
+            value_surf = render_shadowed(self.font_small, values[i], FONT_COLOR_DEFAULT)
+            value_x = self._right_x(value_surf)
+            blits.append((value_surf, (value_x, y_pos)))
 
-            value_surf = self.font_small.render(values[i], True, FONT_COLOR_DEFAULT)
-            value_x = self.right_align_x - value_surf.get_width()
-            blit_with_shadow(surface, value_surf, (value_x, y_pos))
+        blit_batch(surface, blits)
 
     def draw_page_2(self, surface: pygame.Surface) -> None:
         """Draws page 2: Hunger, strength, level, exp, and compact status for all rulesets, with icons for level, exp, and mistakes."""
-        distance = int(37 * UI_SCALE)
-        module = get_module(self.pet.module)
+        pet = self.pet
+        blits = []
 
         # Hunger
-        blit_with_shadow(surface, self.font_small.render("Hunger:", True, FONT_COLOR_DEFAULT), (PAGE_MARGIN, PAGE_MARGIN))
-        self.draw_hearts(surface, int(SCREEN_WIDTH - (110 * UI_SCALE)), PAGE_MARGIN + int(5 * UI_SCALE), self.pet.hunger)
+        blits.append((render_shadowed(self.font_small, "Hunger:", FONT_COLOR_DEFAULT), (PAGE_MARGIN, PAGE_MARGIN)))
+        self.draw_hearts(blits, HEARTS_X, ROW_YS[0] + ICON_Y_OFFSET, pet.hunger)
 
         # Strength
-        blit_with_shadow(surface, self.font_small.render("Strength:", True, FONT_COLOR_DEFAULT), (PAGE_MARGIN, PAGE_MARGIN + distance))
-        self.draw_hearts(surface, int(SCREEN_WIDTH - (110 * UI_SCALE)), PAGE_MARGIN + distance + int(5 * UI_SCALE), self.pet.strength)
+        blits.append((render_shadowed(self.font_small, "Strength:", FONT_COLOR_DEFAULT), (PAGE_MARGIN, ROW_YS[1])))
+        self.draw_hearts(blits, HEARTS_X, ROW_YS[1] + ICON_Y_OFFSET, pet.strength)
 
         # Level and Experience (on the same line, with icons)
-        level_exp_y = PAGE_MARGIN + distance * 2
-        icon_spacing = int(40 * UI_SCALE)
-        icon_y = level_exp_y - int(2 * UI_SCALE)
+        level_exp_y = ROW_YS[2]
+        icon_spacing = LEVEL_ICON_SPACING
+        icon_y = level_exp_y - LEVEL_ICON_Y_OFFSET
         # Level icon and value
-        blit_with_shadow(surface, self.sprites["level"], (PAGE_MARGIN, icon_y))
-        level_text = self.font_small.render(f"Lv: {getattr(self.pet, 'level', '-')}", True, FONT_COLOR_DEFAULT)
-        blit_with_shadow(surface, level_text, (PAGE_MARGIN + icon_spacing, level_exp_y))
+        blits.append((self.sprites_shadowed["level"], (PAGE_MARGIN, icon_y)))
+        level_text = render_shadowed(self.font_small, f"Lv: {pet.level}", FONT_COLOR_DEFAULT)
+        blits.append((level_text, (PAGE_MARGIN + icon_spacing, level_exp_y)))
         # Exp icon and value
         exp_icon_x = PAGE_MARGIN + icon_spacing * 2
-        exp_val = getattr(self.pet, 'exp', getattr(self.pet, 'experience', '-'))
-        exp_text = self.font_small.render(f"EXP: {exp_val}", True, FONT_COLOR_DEFAULT)
-        blit_with_shadow(surface, exp_text, (exp_icon_x + icon_spacing, level_exp_y))
+        exp_text = render_shadowed(self.font_small, f"EXP: {pet.experience}", FONT_COLOR_DEFAULT)
+        blits.append((exp_text, (exp_icon_x + icon_spacing, level_exp_y)))
 
         # Condition hearts or mistakes (next line, with icon for mistakes)
-        y_pos = PAGE_MARGIN + distance * 3
-        if getattr(module, "use_condition_hearts", False):
-            blit_with_shadow(surface, self.font_small.render("Condition:", True, FONT_COLOR_DEFAULT), (PAGE_MARGIN, y_pos))
-            self.draw_hearts(surface, int(SCREEN_WIDTH - (110 * UI_SCALE)), y_pos + int(5 * UI_SCALE), getattr(self.pet, "condition_hearts", 0))
+        y_pos = ROW_YS[3]
+        # The pet copies the module's flag on reset; only older saves need the module lookup
+        use_condition_hearts = getattr(pet, "use_condition_hearts", None)
+        if use_condition_hearts is None:
+            use_condition_hearts = getattr(get_module(pet.module), "use_condition_hearts", False)
+        if use_condition_hearts:
+            blits.append((render_shadowed(self.font_small, "Condition:", FONT_COLOR_DEFAULT), (PAGE_MARGIN, y_pos)))
+            self.draw_hearts(blits, HEARTS_X, y_pos + ICON_Y_OFFSET, getattr(pet, "condition_hearts", 0))
         else:
-            mistakes = getattr(self.pet, "mistakes", 0)
-            blit_with_shadow(surface, self.sprites["mistakes"], (PAGE_MARGIN, y_pos))
-            mistakes_text = self.font_small.render(f"Mistakes: {mistakes}", True, FONT_COLOR_DEFAULT)
-            blit_with_shadow(surface, mistakes_text, (PAGE_MARGIN + icon_spacing, y_pos))
+            blits.append((self.sprites_shadowed["mistakes"], (PAGE_MARGIN, y_pos)))
+            mistakes_text = render_shadowed(self.font_small, f"Mistakes: {pet.mistakes}", FONT_COLOR_DEFAULT)
+            blits.append((mistakes_text, (PAGE_MARGIN + icon_spacing, y_pos)))
 
         # Sleep disturbances, overfeed, sick (all on the same line, with icons)
-        y_pos2 = PAGE_MARGIN + distance * 4
-        icon_spacing = int(80 * UI_SCALE)
+        y_pos2 = ROW_YS[4]
+        icon_spacing = STAT_ICON_SPACING
         x_icon = PAGE_MARGIN
 
         # Sleep Disturbances
-        blit_with_shadow(surface, self.sprites["sleep Dist."], (x_icon, y_pos2))
-        sleep_dist = getattr(self.pet, "sleep_disturbances", 0)
-        sleep_text = self.font_small.render(str(sleep_dist), True, FONT_COLOR_DEFAULT)
-        blit_with_shadow(surface, sleep_text, (x_icon + int(32 * UI_SCALE), y_pos2))
+        blits.append((self.sprites_shadowed["sleep Dist."], (x_icon, y_pos2)))
+        sleep_text = render_shadowed(self.font_small, str(pet.sleep_disturbances), FONT_COLOR_DEFAULT)
+        blits.append((sleep_text, (x_icon + STAT_VALUE_OFFSET, y_pos2)))
 
         # Overfeed
         x_icon += icon_spacing
-        blit_with_shadow(surface, self.sprites["overfeed"], (x_icon, y_pos2))
-        overfeed = getattr(self.pet, "overfeed", 0)
-        overfeed_text = self.font_small.render(str(overfeed), True, FONT_COLOR_DEFAULT)
-        blit_with_shadow(surface, overfeed_text, (x_icon + int(32 * UI_SCALE), y_pos2))
+        blits.append((self.sprites_shadowed["overfeed"], (x_icon, y_pos2)))
+        overfeed_text = render_shadowed(self.font_small, str(pet.overfeed), FONT_COLOR_DEFAULT)
+        blits.append((overfeed_text, (x_icon + STAT_VALUE_OFFSET, y_pos2)))
 
         # Sick
         x_icon += icon_spacing
-        blit_with_shadow(surface, self.sprites["sick"], (x_icon, y_pos2))
-        sick = getattr(self.pet, "injuries", 0)
-        sick_text = self.font_small.render(str(sick), True, FONT_COLOR_DEFAULT)
-        blit_with_shadow(surface, sick_text, (x_icon + int(32 * UI_SCALE), y_pos2))
+        blits.append((self.sprites_shadowed["sick"], (x_icon, y_pos2)))
+        sick_text = render_shadowed(self.font_small, str(pet.injuries), FONT_COLOR_DEFAULT)
+        blits.append((sick_text, (x_icon + STAT_VALUE_OFFSET, y_pos2)))
 
         # Can Battle and Can Jogress (on the same line, compact)
-        y_pos3 = PAGE_MARGIN + distance * 5
-        can_battle = "Y" if getattr(self.pet, "can_battle", lambda: False)() else "N"
-        can_jogress = "Y" if getattr(self.pet, "jogress_avaliable", False) else "N"
+        y_pos3 = ROW_YS[5]
+        can_battle = "Y" if pet.can_battle() else "N"
+        can_jogress = "Y" if pet.jogress_avaliable else "N"
         battle_jogress_text = f"Battle: {can_battle}   Jogress: {can_jogress}"
-        blit_with_shadow(surface, self.font_small.render(battle_jogress_text, True, FONT_COLOR_DEFAULT), (PAGE_MARGIN, y_pos3))
+        blits.append((render_shadowed(self.font_small, battle_jogress_text, FONT_COLOR_DEFAULT), (PAGE_MARGIN, y_pos3)))
+
+        blit_batch(surface, blits)
 
     def draw_dmc_stats(self, surface, distance):
         """Draws DMC-specific stats (mistakes, sleep disturbances, sickness)."""
         labels = ["mistakes", "sleep Dist.", "overfeed", "sick"]
         values = [self.pet.mistakes, self.pet.sleep_disturbances, self.pet.overfeed, self.pet.injuries]
+        blits = []
 
         for i, label in enumerate(labels):
             y_pos = PAGE_MARGIN + (distance * (2 + i))
-            blit_with_shadow(surface, self.sprites[label], (int(10 * UI_SCALE), y_pos))
-            blit_with_shadow(surface, self.font_small.render(label.capitalize() + ":", True, FONT_COLOR_DEFAULT), (int(40 * UI_SCALE), y_pos))
-            blit_with_shadow(surface, self.font_small.render(str(values[i]), True, FONT_COLOR_DEFAULT), (self.right_align_x, y_pos))
+            blits.append((self.sprites_shadowed[label], (ICON_X, y_pos)))
+            blits.append((render_shadowed(self.font_small, label.capitalize() + ":", FONT_COLOR_DEFAULT), (LABEL_X, y_pos)))
+            blits.append((render_shadowed(self.font_small, str(values[i]), FONT_COLOR_DEFAULT), (self.right_align_x, y_pos)))
+
+        blit_batch(surface, blits)
 
     def draw_penc_stats(self, surface, distance):
         """Draws PenC-specific stats (condition hearts, jogress, battle availability)."""
-        blit_with_shadow(surface, self.font_small.render("Condition:", True, FONT_COLOR_DEFAULT), (PAGE_MARGIN, PAGE_MARGIN + (distance * 2)))
-        self.draw_hearts(surface, int(SCREEN_WIDTH - (110 * UI_SCALE)), PAGE_MARGIN + (distance * 2) + int(5 * UI_SCALE), self.pet.condition_hearts)
+        blits = []
+        blits.append((render_shadowed(self.font_small, "Condition:", FONT_COLOR_DEFAULT), (PAGE_MARGIN, PAGE_MARGIN + (distance * 2))))
+        self.draw_hearts(blits, HEARTS_X, PAGE_MARGIN + (distance * 2) + ICON_Y_OFFSET, self.pet.condition_hearts)
 
         labels = ["jogress", "battle"]
         values = [self.pet.jogress_avaliable, self.pet.can_battle()]
@@ -228,185 +331,198 @@ class WindowStatus:
 
         for i, label in enumerate(labels):
             y_pos = PAGE_MARGIN + (distance * (3 + i))
-            blit_with_shadow(surface, self.sprites[label], (int(10 * UI_SCALE), y_pos))
-            blit_with_shadow(surface, self.font_small.render(label.capitalize() + ":", True, FONT_COLOR_DEFAULT), (int(40 * UI_SCALE), y_pos))
-            blit_with_shadow(surface, self.font_small.render(yes_no_values[i], True, FONT_COLOR_DEFAULT), (self.right_align_x, y_pos))    
+            blits.append((self.sprites_shadowed[label], (ICON_X, y_pos)))
+            blits.append((render_shadowed(self.font_small, label.capitalize() + ":", FONT_COLOR_DEFAULT), (LABEL_X, y_pos)))
+            blits.append((render_shadowed(self.font_small, yes_no_values[i], FONT_COLOR_DEFAULT), (self.right_align_x, y_pos)))    
 
         y_pos = PAGE_MARGIN + (distance * (5))
-        blit_with_shadow(surface, self.sprites["sick"], (int(10 * UI_SCALE), y_pos))
-        blit_with_shadow(surface, self.font_small.render("Sick" + ":", True, FONT_COLOR_DEFAULT), (int(40 * UI_SCALE), y_pos))
-        blit_with_shadow(surface, self.font_small.render(str(self.pet.injuries), True, FONT_COLOR_DEFAULT), (self.right_align_x, y_pos))  
+        blits.append((self.sprites_shadowed["sick"], (ICON_X, y_pos)))
+        blits.append((render_shadowed(self.font_small, "Sick" + ":", FONT_COLOR_DEFAULT), (LABEL_X, y_pos)))
+        blits.append((render_shadowed(self.font_small, str(self.pet.injuries), FONT_COLOR_DEFAULT), (self.right_align_x, y_pos)))  
+
+        blit_batch(surface, blits)
 
     def draw_dmx_stats(self, surface, distance):
         """Draws DMX-specific stats (level, mistakes, sickness)."""
         labels = ["level", "exp", "mistakes", "sick"]
         values = [self.pet.level, self.pet.experience, self.pet.mistakes, self.pet.injuries]
+        blits = []
 
         for i, label in enumerate(labels):
             y_pos = PAGE_MARGIN + (distance * (2 + i))
-            blit_with_shadow(surface, self.sprites[label], (int(10 * UI_SCALE), y_pos))
-            blit_with_shadow(surface, self.font_small.render(label.capitalize() + ":", True, FONT_COLOR_DEFAULT), (int(40 * UI_SCALE), y_pos))
-            blit_with_shadow(surface, self.font_small.render(str(values[i]), True, FONT_COLOR_DEFAULT), (self.right_align_x, y_pos))
+            blits.append((self.sprites_shadowed[label], (ICON_X, y_pos)))
+            blits.append((render_shadowed(self.font_small, label.capitalize() + ":", FONT_COLOR_DEFAULT), (LABEL_X, y_pos)))
+            blits.append((render_shadowed(self.font_small, str(values[i]), FONT_COLOR_DEFAULT), (self.right_align_x, y_pos)))
+
+        blit_batch(surface, blits)
 
     def draw_page_3(self, surface: pygame.Surface) -> None:
         """
         Draws page 3: Effort, power, DP bar, battles, and win rates.
         """
-        distance = int(37 * UI_SCALE)
+        distance = ROW_DISTANCE
         y = PAGE_MARGIN
+        blits = []
 
         # Effort
-        effort_label = self.font_small.render("Effort:", True, FONT_COLOR_DEFAULT)
-        blit_with_shadow(surface, effort_label, (PAGE_MARGIN, y))
-        self.draw_hearts(surface, int(SCREEN_WIDTH - (110 * UI_SCALE)), y + int(5 * UI_SCALE), self.pet.effort, factor=2)
+        effort_label = render_shadowed(self.font_small, "Effort:", FONT_COLOR_DEFAULT)
+        blits.append((effort_label, (PAGE_MARGIN, y)))
+        self.draw_hearts(blits, HEARTS_X, y + ICON_Y_OFFSET, self.pet.effort, factor=2)
 
         # Power
         y += distance
-        power_label = self.font_small.render("Power:", True, FONT_COLOR_DEFAULT)
-        blit_with_shadow(surface, power_label, (PAGE_MARGIN, y))
+        power_label = render_shadowed(self.font_small, "Power:", FONT_COLOR_DEFAULT)
+        blits.append((power_label, (PAGE_MARGIN, y)))
 
         power_value = self.pet.get_power()
         power_color = FONT_COLOR_DEFAULT if power_value == self.pet.power else (0, 255, 0)
-        power_text = self.font_small.render(str(power_value), True, power_color)
-        blit_with_shadow(surface, power_text, (self.right_align_x - power_text.get_width(), y))
+        power_text = render_shadowed(self.font_small, str(power_value), power_color)
+        blits.append((power_text, (self._right_x(power_text), y)))
 
         # DP (energy bar)
         y += distance
-        dp_label = self.font_small.render("DP:", True, FONT_COLOR_DEFAULT)
-        blit_with_shadow(surface, dp_label, (PAGE_MARGIN, y))
-        self.draw_energy_bar(surface, SCREEN_WIDTH, y, self.pet.dp, self.pet.energy)
+        dp_label = render_shadowed(self.font_small, "DP:", FONT_COLOR_DEFAULT)
+        blits.append((dp_label, (PAGE_MARGIN, y)))
+        self.draw_energy_bar(blits, SCREEN_WIDTH, y, self.pet.dp, self.pet.energy)
 
         # Battles
         y += distance
-        battles_label = self.font_small.render("Battles:", True, FONT_COLOR_DEFAULT)
-        battles_value = self.font_small.render(f"{self.pet.battles}/{self.pet.totalBattles}", True, FONT_COLOR_DEFAULT)
-        blit_with_shadow(surface, battles_label, (PAGE_MARGIN, y))
-        blit_with_shadow(surface, battles_value, (self.right_align_x - battles_value.get_width(), y))
+        battles_label = render_shadowed(self.font_small, "Battles:", FONT_COLOR_DEFAULT)
+        battles_value = render_shadowed(self.font_small, f"{self.pet.battles}/{self.pet.totalBattles}", FONT_COLOR_DEFAULT)
+        blits.append((battles_label, (PAGE_MARGIN, y)))
+        blits.append((battles_value, (self._right_x(battles_value), y)))
 
         # Win rates
         y += distance
         stage_win_rate = (self.pet.win * 100 // self.pet.battles) if self.pet.battles > 0 else 0
         total_win_rate = (self.pet.totalWin * 100 // self.pet.totalBattles) if self.pet.totalBattles > 0 else 0
 
-        win_stage_label = self.font_small.render("Win Rate:", True, FONT_COLOR_DEFAULT)
-        win_total_label = self.font_small.render("Win Rate T.:", True, FONT_COLOR_DEFAULT)
-        blit_with_shadow(surface, win_stage_label, (PAGE_MARGIN, y))
-        blit_with_shadow(surface, win_total_label, (PAGE_MARGIN, y + distance))
+        win_stage_label = render_shadowed(self.font_small, "Win Rate:", FONT_COLOR_DEFAULT)
+        win_total_label = render_shadowed(self.font_small, "Win Rate T.:", FONT_COLOR_DEFAULT)
+        blits.append((win_stage_label, (PAGE_MARGIN, y)))
+        blits.append((win_total_label, (PAGE_MARGIN, y + distance)))
 
-        win_stage_value = self.font_small.render(f"{stage_win_rate}%", True, FONT_COLOR_DEFAULT)
-        win_total_value = self.font_small.render(f"{total_win_rate}%", True, FONT_COLOR_DEFAULT)
-        blit_with_shadow(surface, win_stage_value, (self.right_align_x - win_stage_value.get_width(), y))
-        blit_with_shadow(surface, win_total_value, (self.right_align_x - win_total_value.get_width(), y + distance))
+        win_stage_value = render_shadowed(self.font_small, f"{stage_win_rate}%", FONT_COLOR_DEFAULT)
+        win_total_value = render_shadowed(self.font_small, f"{total_win_rate}%", FONT_COLOR_DEFAULT)
+        blits.append((win_stage_value, (self._right_x(win_stage_value), y)))
+        blits.append((win_total_value, (self._right_x(win_total_value), y + distance)))
+
+        blit_batch(surface, blits)
 
 
     def draw_page_4(self, surface: pygame.Surface) -> None:
         """
         Draws page 4: Evolution time, sleep/wake times, poop/feed times, and flags.
         """
-        distance = int(37 * UI_SCALE)
+        distance = ROW_DISTANCE
         y = PAGE_MARGIN
-
-        def format_seconds(seconds: int) -> str:
-            if seconds > 0:
-                hours = seconds // 3600
-                minutes = (seconds % 3600) // 60
-                return f"{hours:02}:{minutes:02}"
-            return "00:00"
+        blits = []
 
         # Evolution time
-        evolution_label = self.font_small.render("Evolution:", True, FONT_COLOR_DEFAULT)
+        evolution_label = render_shadowed(self.font_small, "Evolution:", FONT_COLOR_DEFAULT)
         if self.pet.time >= 0 and self.pet.evolve:
             evolution_seconds = (self.pet.time * 60) - (self.pet.timer // 30)
             evolution_text = format_seconds(evolution_seconds) if evolution_seconds > 0 else "00:00"
         else:
             evolution_text = ""
-        evolution_value = self.font_small.render(evolution_text, True, FONT_COLOR_DEFAULT)
-        blit_with_shadow(surface, evolution_label, (PAGE_MARGIN, y))
-        blit_with_shadow(surface, evolution_value, (self.right_align_x - evolution_value.get_width(), y))
+        evolution_value = render_shadowed(self.font_small, evolution_text, FONT_COLOR_DEFAULT)
+        blits.append((evolution_label, (PAGE_MARGIN, y)))
+        blits.append((evolution_value, (self._right_x(evolution_value), y)))
 
         # Sleeps
         y += distance
-        sleeps_label = self.font_small.render("Sleeps:", True, FONT_COLOR_DEFAULT)
-        sleeps_value = self.font_small.render(self.pet.sleeps, True, FONT_COLOR_DEFAULT)
-        blit_with_shadow(surface, sleeps_label, (PAGE_MARGIN, y))
-        blit_with_shadow(surface, sleeps_value, (self.right_align_x - sleeps_value.get_width(), y))
+        sleeps_label = render_shadowed(self.font_small, "Sleeps:", FONT_COLOR_DEFAULT)
+        sleeps_value = render_shadowed(self.font_small, self.pet.sleeps, FONT_COLOR_DEFAULT)
+        blits.append((sleeps_label, (PAGE_MARGIN, y)))
+        blits.append((sleeps_value, (self._right_x(sleeps_value), y)))
 
         # Wakes (currently fixed at 00:00)
         y += distance
-        wakes_label = self.font_small.render("Wakes:", True, FONT_COLOR_DEFAULT)
-        wakes_value = self.font_small.render(self.pet.wakes, True, FONT_COLOR_DEFAULT)
-        blit_with_shadow(surface, wakes_label, (PAGE_MARGIN, y))
-        blit_with_shadow(surface, wakes_value, (self.right_align_x - wakes_value.get_width(), y))
+        wakes_label = render_shadowed(self.font_small, "Wakes:", FONT_COLOR_DEFAULT)
+        wakes_value = render_shadowed(self.font_small, self.pet.wakes, FONT_COLOR_DEFAULT)
+        blits.append((wakes_label, (PAGE_MARGIN, y)))
+        blits.append((wakes_value, (self._right_x(wakes_value), y)))
 
         # Poop Time
         y += distance
-        poop_label = self.font_small.render("Poop Time:", True, FONT_COLOR_DEFAULT)
+        poop_label = render_shadowed(self.font_small, "Poop Time:", FONT_COLOR_DEFAULT)
         poop_seconds = (self.pet.poop_timer * 60) - (self.pet.timer // 30 % (self.pet.poop_timer * 60))
         poop_text = format_seconds(poop_seconds)
-        poop_value = self.font_small.render(poop_text, True, FONT_COLOR_DEFAULT)
-        blit_with_shadow(surface, poop_label, (PAGE_MARGIN, y))
-        blit_with_shadow(surface, poop_value, (self.right_align_x - poop_value.get_width(), y))
+        poop_value = render_shadowed(self.font_small, poop_text, FONT_COLOR_DEFAULT)
+        blits.append((poop_label, (PAGE_MARGIN, y)))
+        blits.append((poop_value, (self._right_x(poop_value), y)))
 
         # Feed Time
         y += distance
-        feed_label = self.font_small.render("Feed Time:", True, FONT_COLOR_DEFAULT)
+        feed_label = render_shadowed(self.font_small, "Feed Time:", FONT_COLOR_DEFAULT)
         feed_seconds = (self.pet.hunger_loss * 60) - (self.pet.timer // 30 % (self.pet.hunger_loss * 60))
         feed_text = format_seconds(feed_seconds)
-        feed_value = self.font_small.render(feed_text, True, FONT_COLOR_DEFAULT)
-        blit_with_shadow(surface, feed_label, (PAGE_MARGIN, y))
-        blit_with_shadow(surface, feed_value, (self.right_align_x - feed_value.get_width(), y))
+        feed_value = render_shadowed(self.font_small, feed_text, FONT_COLOR_DEFAULT)
+        blits.append((feed_label, (PAGE_MARGIN, y)))
+        blits.append((feed_value, (self._right_x(feed_value), y)))
 
         # Flags
         y += distance
-        flags_label = self.font_small.render("Flags:", True, FONT_COLOR_DEFAULT)
-        flags_value = self.font_small.render("", True, FONT_COLOR_DEFAULT)  # Empty placeholder
-        blit_with_shadow(surface, flags_label, (PAGE_MARGIN, y))
-        blit_with_shadow(surface, flags_value, (self.right_align_x - flags_value.get_width(), y))
+        flags_label = render_shadowed(self.font_small, "Flags:", FONT_COLOR_DEFAULT)
+        flags_value = render_shadowed(self.font_small, "", FONT_COLOR_DEFAULT)  # Empty placeholder
+        blits.append((flags_label, (PAGE_MARGIN, y)))
+        blits.append((flags_value, (self._right_x(flags_value), y)))
 
-        current_x = PAGE_MARGIN + int(70 * UI_SCALE)
-        flag_y = y + int(5 * UI_SCALE)
+        current_x = FLAGS_X
+        flag_y = y + ICON_Y_OFFSET
 
         # Draw flag icons if present, spacing them horizontally by 24 pixels
         for flag_name in ["special", "shook", "traited", "shiny"]:
             if getattr(self.pet, flag_name, False):
-                blit_with_shadow(surface, self.sprites[flag_name], (current_x, flag_y))
-                current_x += int(24 * UI_SCALE)
+                blits.append((self.sprites_shadowed[flag_name], (current_x, flag_y)))
+                current_x += ICON_SPACING
 
+        blit_batch(surface, blits)
 
-    def draw_hearts(self, surface: pygame.Surface, x: int, y: int, value: int, factor: int = 1) -> None:
+
+    def build_heart_rows(self):
         """
-        Draws heart icons to represent hunger, strength, or effort.
-        Displays full, half, or empty hearts based on the `value` and `factor`.
+        Precomputes the queued blits for every hearts row, indexed by filled halves (0-8).
+        Each entry is a list of (sprite, dx, dy) offsets using the pre-shadowed hearts.
         """
         total_hearts = 4
-        heart_spacing = int(24 * UI_SCALE)
-
-        heart_full = self.sprites["heart_full"]
-        heart_half = self.sprites["heart_half"]
-        heart_empty = self.sprites["heart_empty"]
-
-        for i in range(total_hearts):
-            heart_x = x + i * heart_spacing
-            heart_threshold = (i + 1) * factor
-            half_threshold = i * factor + (factor / 2)
+        heart_spacing = ICON_SPACING
+        hearts = (self.sprites_shadowed["heart_empty"], self.sprites_shadowed["heart_half"], self.sprites_shadowed["heart_full"])
+
+        rows = []
+        for halves in range(total_hearts * 2 + 1):
+            row = []
+            for i in range(total_hearts):
+                # 2 = full, 1 = half, 0 = empty
+                heart = hearts[max(0, min(2, halves - i * 2))]
+                row.append((heart, i * heart_spacing, 0))
+            rows.append(row)
+        return rows
+
+    def draw_hearts(self, blits: list, x: int, y: int, value: int, factor: int = 1) -> None:
+        """
+        Queues heart icons to represent hunger, strength, or effort onto `blits`.
+        Displays full, half, or empty hearts based on the `value` and `factor`.
+        """
+        halves = max(0, min(8, value * 2 // factor))
+        blits.extend((sprite, (x + dx, y + dy)) for sprite, dx, dy in self._heart_rows[halves])
 
-            if value >= heart_threshold:
-                blit_with_shadow(surface, heart_full, (heart_x, y))
-            elif value >= half_threshold:
-                blit_with_shadow(surface, heart_half, (heart_x, y))
-            else:
-                blit_with_shadow(surface, heart_empty, (heart_x, y))
+    def build_energy_offsets(self):
+        """
+        Precomputes the (dx, dy) offset of every DP bar block, right to left from the bar's x.
+        Slicing the first N entries gives the blocks for N filled.
+        """
+        step = self.sprites["energy_bar"].get_width() + BLOCK_SPACING
+        return [(-5 - (i + 1) * step, ICON_Y_OFFSET) for i in range(ENERGY_BAR_BLOCKS)]
 
-    def draw_energy_bar(self, surface: pygame.Surface, x: int, y: int, value: int, max_value: int) -> None:
+    def draw_energy_bar(self, blits: list, x: int, y: int, value: int, max_value: int) -> None:
         """
-        Draws the DP energy bar showing current energy `value` out of `max_value`.
+        Queues the DP energy bar showing current energy `value` out of `max_value` onto `blits`.
         The bar consists of multiple blocks with background and filled blocks.
         """
         
         max_energy = max(1, max_value)  # Prevent division by zero
-        visible_blocks = 13
-        block_spacing = int(2 * UI_SCALE)
-        block_width = self.sprites["energy_bar"].get_width()
+        visible_blocks = ENERGY_BAR_BLOCKS
 
         # Calculate how many blocks to fill
         if value <= 0:
@@ -421,7 +537,5 @@ class WindowStatus:
         #surface.blit(self.sprites["energy_bar_back"], ((x - 5) - (visible_blocks * (block_width + block_spacing) * UI_SCALE), y + int(4 * UI_SCALE)))
 
         # Draw filled energy blocks
-        for i in range(filled_blocks):
-            bar_x = (x - 5) - (i + 1) * (block_width + block_spacing)
-            #surface.blit(self.sprites["energy_bar"], (bar_x, y + int(5 * UI_SCALE)))
-            blit_with_cache(surface, self.sprites["energy_bar"], (bar_x, y + int(5 * UI_SCALE)))
+        energy_bar = self.sprites["energy_bar"]
+        blits.extend((energy_bar, (x + dx, y + dy)) for dx, dy in self._energy_offsets[:filled_blocks])
@@ -88,9 +88,8 @@ class HeadToHeadTraining(Training):
         left_frame = PetFrame.ATK2.value if self.phase == "attack_move" else PetFrame.ATK1.value
         right_frame = PetFrame.ATK2.value if self.phase == "attack_move" else PetFrame.ATK1.value
 
-        left_sprite = runtime_globals.pet_sprites[self.left_pet][left_frame]
+        left_sprite = self.left_pet.get_flipped_sprite(left_frame)
         right_sprite = runtime_globals.pet_sprites[self.right_pet][right_frame]
-        left_sprite = pygame.transform.flip(left_sprite, True, False)
 
         blit_with_shadow(surface, left_sprite, (0 + (5 * UI_SCALE), SCREEN_HEIGHT // 2 - int(PET_HEIGHT) // 2))
         blit_with_shadow(surface, right_sprite, (SCREEN_WIDTH - PET_WIDTH - (5 * UI_SCALE), SCREEN_HEIGHT // 2 - int(PET_HEIGHT) // 2))
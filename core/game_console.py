@@ -14,13 +14,18 @@ class GameConsole:
     """
 
     @staticmethod
-    def log(message: str) -> None:
+    def log(message: str, *args) -> None:
         """
         Logs a timestamped message to the console if debug mode is enabled.
+        When args are given, message is a %-style format string that is only
+        interpolated once debug mode is known to be on.
         
         Args:
-            message (str): Message to be logged.
+            message (str): Message (or format string) to be logged.
+            *args: Values substituted into message.
         """
         if game_globals.debug:
+            if args:
+                message = message % args
             timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             print(f"[{timestamp}] {message}")
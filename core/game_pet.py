@@ -1,21 +1,142 @@
+from array import array
 from datetime import datetime
+import functools
+import math
 import pygame
 import random
 import os
+import time
 
 from core import game_globals, runtime_globals
 from core.animation import Animation, PetFrame
 from core.constants import *
 from core.constants import MAX_LEVEL
 from core.constants import EXPERIENCE_LEVEL
+from core.game_console import GameConsole
 from core.game_digidex import register_digidex_entry
 from core.game_module import sprite_load
 from core.game_poop import GamePoop
 from core.utils.module_utils import get_module
-from core.utils.pygame_utils import blit_with_cache
+from core.utils.pygame_utils import blit_batch
 from core.utils.scene_utils import change_scene
 from core.utils.utils_unlocks import is_unlocked, unlock_item
 
+# GameConsole.log is a staticmethod that only formats its args in debug mode; bound once here
+_log = GameConsole.log
+# Bound method of the shared module-level generator, so random.seed() still applies
+_random = random.random
+
+# Tick counts for the timer checks, computed once instead of on every update
+MINUTE_TICKS = FRAME_RATE * 60
+DAY_TICKS = 24 * 60 * MINUTE_TICKS
+AGE_48H_TICKS = 48 * 60 * MINUTE_TICKS
+
+# Per-frame animation cadences, scaled from their 30 fps values
+_ANIM_FRAME_TICKS = FRAME_RATE // 3  # moving frames advance with each step
+_HALF_SECOND_TICKS = FRAME_RATE // 2
+_STATE_RESET_TICKS = int(4 * FRAME_RATE)
+_HATCH_TICKS = 1750 * 30 / FRAME_RATE
+_POOP_SHAKE_RIGHT = frozenset({0, int(6 * (FRAME_RATE / 30))})
+_POOP_SHAKE_LEFT = frozenset({int(3 * (FRAME_RATE / 30)), int(9 * (FRAME_RATE / 30))})
+_POOP_DROP_TICK = int(15 * (FRAME_RATE / 30))
+_POOP_SHAKE_STEP = int(2 * UI_SCALE)
+
+# Idle movement draws; tuples so random.choice doesn't get a fresh list on every call
+_DIRECTIONS = (-1, 1)
+_MOVE_STEPS = (2, 6)
+_MOVE_CHANCE = 1 - IDLE_PROBABILITY
+
+# State overlays: state -> (misc sprite key per animation phase, shown over the sick overlay, drawn level with the pet)
+_STATE_OVERLAYS = {
+    "nap": (("Sleep1", "Sleep2"), True, False),
+    "happy2": (("Cheer", None), True, True),
+    "happy3": (("Cheer", None), True, True),
+    "angry": (("Mad1", "Mad2"), False, False),
+}
+_SICK_OVERLAYS = ("Sick1", "Sick2")
+
+# Extra overlay copies around a happy3 pet, relative to the base overlay position
+_HAPPY3_OFFSETS = (
+    (0, 24 * UI_SCALE),
+    (-PET_WIDTH - (24 * UI_SCALE), 0),
+    (-PET_WIDTH - (24 * UI_SCALE), 24 * UI_SCALE),
+)
+
+# Lower-case state name -> Animation frame list, so set_state skips upper() + getattr.
+# States without an Animation of their own ("dead" draws the dead frame) use IDLE.
+_STATE_ANIMATIONS = {name.lower(): frames for name, frames in vars(Animation).items() if name.isupper()}
+_STATE_ANIMATIONS.update({"dead": Animation.IDLE, "happy1": Animation.IDLE})
+
+# Module death rules copied onto each pet as _<name> so check_death_conditions reads plain attributes
+_DEATH_RULES = (
+    "death_max_injuries", "death_sick_timer", "death_hunger_timer", "death_strength_timer",
+    "death_stage45_mistake", "death_stage67_mistake", "death_starvation_count", "death_care_mistake",
+    "death_save_by_b_press", "death_save_by_shake",
+)
+
+# DMX power bonus by level: +10 at levels 3, 6 and 9 (index with min(level, 9))
+_DMX_LEVEL_BONUS = (0, 0, 0, 10, 10, 10, 20, 20, 20, 30)
+
+# Range requirements an evolution entry may carry, in the order update_evolution tests them,
+# as the expression the generated matcher compares against the entry's bounds
+_EVO_RANGE_CHECKS = (
+    ("mistakes", "pet.mistakes"),
+    ("condition_hearts", "pet.condition_hearts"),
+    ("training", "pet.effort // 4"),
+    ("overfeed", "pet.overfeed"),
+    ("level", "pet.level"),
+    ("stage-5", "pet.enemy_kills[5]"),
+    ("stage-6", "pet.enemy_kills[6]"),
+    ("stage-7", "pet.enemy_kills[7]"),
+    ("stage-8", "pet.enemy_kills[8]"),
+    ("stage-9", "pet.enemy_kills[9]"),
+    ("sleep_disturbances", "pet.sleep_disturbances"),
+    ("battles", "pet.battles"),
+)
+
+def compile_evolutions(evolve):
+    """
+    Generates a matcher for an evolve list: a generator function that takes the pet and
+    yields, in list order, each entry whose ranges and win ratio it currently meets.
+    Only the keys an entry actually carries are tested. Jogress and item evolutions
+    never evolve on their own, so they are left out.
+    """
+    consts = {}
+
+    def bound(value):
+        # Inline finite numeric bounds as literals; anything else (inf/nan included) is looked up by name
+        if type(value) is int or (type(value) is float and math.isfinite(value)):
+            return repr(value)
+        name = f"c{len(consts)}"
+        consts[name] = value
+        return name
+
+    lines = ["def match(pet):"]
+    for index, evo in enumerate(evolve):
+        if "jogress" in evo or "item" in evo:
+            continue
+        tests = [f"{bound(evo[key][0])} <= {expr} <= {bound(evo[key][1])}" for key, expr in _EVO_RANGE_CHECKS if key in evo]
+        win_ratio = evo.get("win_ratio")
+        if win_ratio:
+            tests.append(f"(not pet.battles or {bound(win_ratio[0])} <= (pet.win * 100) // pet.battles <= {bound(win_ratio[1])})")
+        if tests:
+            lines.append(f"    if {' and '.join(tests)}:")
+            lines.append(f"        yield evolve[{index}]")
+        else:
+            lines.append(f"    yield evolve[{index}]")
+    lines.append("    return")
+    lines.append("    yield")
+
+    namespace = {"evolve": evolve, **consts}
+    exec(compile("\n".join(lines), "<evolutions>", "exec"), namespace)
+    return namespace["match"]
+
+
+@functools.lru_cache(maxsize=None)
+def get_dead_frame():
+    """Returns the dead frame scaled to pet size, loaded once and shared by every dead pet."""
+    return sprite_load(DEAD_FRAME_PATH, size=(PET_WIDTH, PET_HEIGHT))
+
 
 class GamePet:
     def __init__(self, pet_data, traited = False):
@@ -42,12 +163,20 @@ class GamePet:
         self.sleep_start_time = None
         self.sleep_timer = 0 
         self.back_to_sleep = 0
+        self.area = 0
 
         self.level = 1
         self.experience = 0
 
+    def bind_module(self):
+        """Resolves the pet's GameModule once and copies its death rules onto the pet (refreshed on every set_data)."""
+        module = self._module = get_module(self.module)
+        for name in _DEATH_RULES:
+            setattr(self, "_" + name, getattr(module, name))
+
     def set_data(self, data):
         self.module = data["module"]
+        self.bind_module()
         self.name = data["name"]
         self.stage = data["stage"]
         self.version = data["version"]
@@ -59,6 +188,7 @@ class GamePet:
         self.evolve = data["evolve"]
         self.sleeps = data.get("sleeps")
         self.wakes = data.get("wakes")
+        self.update_sleep_schedule()
         self.atk_main = data.get("atk_main", 0)
         self.atk_alt = data.get("atk_alt", 0)
         if self.atk_alt == 0:
@@ -93,7 +223,7 @@ class GamePet:
         self.care_food_mistake_timer = self.care_strength_mistake_timer = self.care_sleep_mistake_timer = self.care_sick_mistake_timer = 0
         self.special_encounter = False
 
-        self.enemy_kills = [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]
+        self.enemy_kills = array("I", [0] * 11)  # Kills per enemy stage
 
         self.starvation_counter = 0
         self.disturbance_penalty = 0
@@ -106,7 +236,7 @@ class GamePet:
         self.sleep_disturbances = 0
         self.protein_overdose = 0
 
-        module = get_module(self.module)
+        module = self._module
 
         if self.traited:
             self.level = module.traited_egg_starting_level
@@ -118,9 +248,11 @@ class GamePet:
 
     def load_sprite(self):
         """Loads animation frames for the pet, replacing `$` in module paths."""
-        runtime_globals.pet_sprites[self] = []
+        # The same list is shared with runtime_globals.pet_sprites, so in-place swaps reach both
+        sprites = self._sprites = runtime_globals.pet_sprites[self] = []
+        runtime_globals.pet_sprites_flipped.pop(self, None)
         
-        module = get_module(self.module)
+        module = self._module
         folder = os.path.join(module.folder_path, "monsters", module.name_format.replace("$", self.name))
 
         for i in range(20):
@@ -128,15 +260,13 @@ class GamePet:
             if not os.path.exists(frame_file):
                 break
             
-            runtime_globals.pet_sprites[self].append(sprite_load(frame_file, size=(PET_WIDTH, PET_HEIGHT)))
+            sprites.append(sprite_load(frame_file, size=(PET_WIDTH, PET_HEIGHT)))
 
-        if get_module(self.module).reverse_atk_frames:
-            sprites = runtime_globals.pet_sprites[self]
+        if self._module.reverse_atk_frames:
             # Swap TRAIN1 <-> ATK1 and TRAIN2 <-> ATK2
-            if len(runtime_globals.pet_sprites[self]) > 6:
+            if len(sprites) > 6:
                 sprites[PetFrame.TRAIN1.value], sprites[PetFrame.TRAIN2.value] = sprites[PetFrame.TRAIN2.value], sprites[PetFrame.TRAIN1.value]  # TRAIN1 ↔ TRAIN2
                 sprites[PetFrame.ATK1.value], sprites[PetFrame.ATK2.value] = sprites[PetFrame.ATK2.value], sprites[PetFrame.ATK1.value]  # ATK1 ↔ ATK2
-            runtime_globals.pet_sprites[self] = sprites
 
     def begin_position(self):
         self.subpixel_x = float(SCREEN_WIDTH - PET_WIDTH) / 2
@@ -145,7 +275,16 @@ class GamePet:
         self.x_range = (0, SCREEN_WIDTH - PET_WIDTH)
 
     def get_sprite(self, index):
-        return runtime_globals.pet_sprites[self][index]
+        return self._sprites[index]
+
+    def get_flipped_sprite(self, index):
+        """Returns the mirrored frame, flipped once and reused until that frame is replaced (e.g. by the dead sprite)."""
+        source = self._sprites[index]
+        flipped = runtime_globals.pet_sprites_flipped.setdefault(self, {})
+        cached = flipped.get(index)
+        if cached is None or cached[0] is not source:
+            cached = flipped[index] = (source, pygame.transform.flip(source, True, False))
+        return cached[1]
 
     def set_state(self, new_state, force=False):
         if self.state == "dead":
@@ -154,16 +293,15 @@ class GamePet:
         if self.state != new_state or force:
             self.state = new_state
             self.animation_counter = 0
-            self.animation_frames = getattr(Animation, new_state.upper(), Animation.IDLE)
+            self.animation_frames = _STATE_ANIMATIONS.get(new_state, Animation.IDLE)
             self.frame_index = self.frame_counter = self.animation_counter = 0
-            runtime_globals.game_console.log(f"{self.name} status {self.state}")
+            _log("%s status %s", self.name, self.state)
 
             if self.state == "nap" and self.should_sleep() and new_state != "nap":
                 self.set_back_to_sleep()
 
             # Handle sleeping
             if new_state == "nap":
-                from datetime import datetime
                 self.sleep_start_time = datetime.now()
                 self.sleep_timer = 0
             elif self.state == "idle":
@@ -172,51 +310,45 @@ class GamePet:
 
     def draw(self, surface):
         # Get base frame; skip if missing
-        sprite_list = runtime_globals.pet_sprites.get(self)
+        sprite_list = self._sprites
         if not sprite_list:
             return
         
         frame_key = self.animation_frames[self.frame_index].value
-        frame = sprite_list[frame_key]
         
         # Flip if facing right
         if self.direction == 1:
-            frame = pygame.transform.flip(frame, True, False)
+            frame = self.get_flipped_sprite(frame_key)
+        else:
+            frame = sprite_list[frame_key]
         
-        # Draw base pet sprite
-        #surface.blit(frame, (self.x, self.y))
-        blit_with_cache(surface, frame, (self.x, self.y))
+        # Base pet sprite first; overlays are queued after it and everything is blitted in one call
+        blits = [(frame, (self.x, self.y))]
         
         # Determine overlay, if any
-        overlay = None
         anim_phase = (self.animation_counter // FRAME_RATE) % 2  # precompute phase
+        entry = _STATE_OVERLAYS.get(self.state)
+        key = entry[0][anim_phase] if entry is not None and entry[1] else None
 
         sick = False
-
-        if self.state == "nap":
-            overlay = runtime_globals.misc_sprites.get(f"Sleep{anim_phase + 1}")
-        elif self.state in {"happy2", "happy3"} and anim_phase == 0:
-            overlay = runtime_globals.misc_sprites.get("Cheer")
-        elif self.sick > 0 and self.state != "dead":
-            overlay = runtime_globals.misc_sprites.get(f"Sick{anim_phase + 1}")
-            sick = True
-        elif self.state == "angry":
-            overlay = runtime_globals.misc_sprites.get(f"Mad{anim_phase + 1}")
+        if key is None:
+            if self.sick > 0 and self.state != "dead":
+                key = _SICK_OVERLAYS[anim_phase]
+                sick = True
+            elif entry is not None:
+                key = entry[0][anim_phase]
+        overlay = runtime_globals.misc_sprites.get(key) if key else None
         
         if overlay:
             x = self.x + PET_WIDTH
-            y = self.y - (PET_WIDTH//2)
-            if self.state in ["happy2", "happy3"]:
-                y = self.y
-            base_pos = (x, y)
-            #surface.blit(overlay, base_pos)
-            blit_with_cache(surface, overlay, base_pos)
+            y = self.y if entry is not None and entry[2] else self.y - (PET_WIDTH//2)
+            blits.append((overlay, (x, y)))
             
             if self.state == "happy3" and not sick:
                 # Draw additional overlay positions
-                blit_with_cache(surface, overlay, (x, y + (24 * UI_SCALE)))
-                blit_with_cache(surface, overlay, (x - PET_WIDTH - (24 * UI_SCALE), y))
-                blit_with_cache(surface, overlay, (x - PET_WIDTH - (24 * UI_SCALE), y + (24 * UI_SCALE)))
+                blits.extend((overlay, (x + dx, y + dy)) for dx, dy in _HAPPY3_OFFSETS)
+
+        blit_batch(surface, blits)
 
     def update(self):
         self.timer += 1
@@ -229,23 +361,23 @@ class GamePet:
             self.sleep_timer += 1
             self.check_wake_up()
         elif self.state == "pooping":
-            if self.frame_counter in [0, int(6 * (FRAME_RATE / 30))]:
-                self.x += int(2 * UI_SCALE)
-            elif self.frame_counter in [int(3 * ((FRAME_RATE / 30))), int(9 * ((FRAME_RATE / 30)))]:
-                self.x -= int(2 * UI_SCALE)
+            if self.frame_counter in _POOP_SHAKE_RIGHT:
+                self.x += _POOP_SHAKE_STEP
+            elif self.frame_counter in _POOP_SHAKE_LEFT:
+                self.x -= _POOP_SHAKE_STEP
 
-            if self.animation_counter == int(15 * (FRAME_RATE / 30)):
+            if self.animation_counter == _POOP_DROP_TICK:
                 self.poop()
-        elif self.state in ("moving", "idle") and self.timer % (FRAME_RATE // 2) == 0 and self.should_sleep():
+        elif self.state in ("moving", "idle") and self.timer % _HALF_SECOND_TICKS == 0 and self.should_sleep():
             self.set_state("tired")
 
-        # Increase age every day (24 * 60 * 60 = 86.400)
-        if self.age_timer % (FRAME_RATE * 86.400) == 0:
+        # Increase age every day (24 * 60 * 60 = 86400 seconds)
+        if self.age_timer % DAY_TICKS == 0:
             self.age += 1
-            runtime_globals.game_console.log(f"{self.name} aged to {self.age}")
+            _log("%s aged to %s", self.name, self.age)
 
         # Check for evolutions once a minute, considering variable FRAME_RATE
-        if self.timer % (FRAME_RATE * 60) == 0:
+        if self.timer % MINUTE_TICKS == 0:
             if self.state not in ("nap", "dead"):
                 self.update_evolution()
                 self.update_needs()
@@ -264,26 +396,25 @@ class GamePet:
             return
 
         self.move_timer -= 1
-        # Determine if we should move
-        move_chance = (1 - IDLE_PROBABILITY)
 
         if self.move_timer <= 0:
             if self.state == "idle" and random.random() < 0.30:
                 self.set_state("sick" if self.sick > 0 else ("happy" if not self.need_care() else "angry"))
-                self.move_timer = random.randint(60, 120)
+                self.move_timer = random.randrange(60, 121)
                 return
 
-            if random.random() < move_chance:
+            # Determine if we should move
+            if random.random() < _MOVE_CHANCE:
                 self.set_state("moving")
-                self.direction = random.choice([-1, 1])
-                self.move_timer = random.randint(20, 60)
+                self.direction = random.choice(_DIRECTIONS)
+                self.move_timer = random.randrange(20, 61)
             else:
                 self.set_state("idle")
-                self.move_timer = random.randint(90, 180)
+                self.move_timer = random.randrange(90, 181)
 
         # Move in sync with frame updates (choppy movement)
-        if self.state == "moving" and self.frame_counter % int(FRAME_RATE / 3) == 0:  # move only when animation frame updates
-            step = random.choice([2, 6])
+        if self.state == "moving" and self.frame_counter % _ANIM_FRAME_TICKS == 0:  # move only when animation frame updates
+            step = random.choice(_MOVE_STEPS)
             self.x += (step * (SCREEN_WIDTH / 240)) * self.direction
             if self.x <= self.x_range[0]:
                 self.x = self.x_range[0]
@@ -301,29 +432,29 @@ class GamePet:
         if self.state == "moving":
             # Move every N frames, same as movement (e.g., every 15 frames)
             self.frame_counter += 1
-            if self.frame_counter % (FRAME_RATE // 3) == 0:
+            if self.frame_counter % _ANIM_FRAME_TICKS == 0:
                 self.frame_index = (self.frame_index + 1) % len(self.animation_frames)
         else:
             # Regular animation update for non-moving states
             self.frame_counter += 1
-            if self.frame_counter > (FRAME_RATE // 2):
+            if self.frame_counter > _HALF_SECOND_TICKS:
                 self.frame_counter = 0
                 self.frame_index = (self.frame_index + 1) % len(self.animation_frames)
 
         # Handle timed state resets
         self.animation_counter += 1
         if self.state not in ("moving", "idle", "nap", "dead"):
-            if self.state != "nap" and self.animation_counter > int(4 * FRAME_RATE):
+            if self.state != "nap" and self.animation_counter > _STATE_RESET_TICKS:
                 self.set_state("happy"if self.state == "eat" else "idle")
 
         # Handle hatching animation
-        if self.stage == 0 and (self.timer * FRAME_RATE/30) >= 1750:
+        if self.stage == 0 and self.timer >= _HATCH_TICKS:
             self.set_state("hatch")
 
     def evolve_to(self, name, version):
-        runtime_globals.game_console.log(f"Evolving to {name}")
+        _log("Evolving to %s", name)
         runtime_globals.game_sound.play("evolution")
-        module = get_module(self.module)
+        module = self._module
         pet_data = module.get_monster(name, version)
         pet_data["module"] = module.name
         self.set_data(pet_data)
@@ -352,34 +483,34 @@ class GamePet:
         result = False
 
         # 1. 15 ou mais ferimentos em uma forma
-        if self.injuries >= get_module(self.module).death_max_injuries:
+        if self.injuries >= self._death_max_injuries:
             result = True
 
         # 2. Ficou ferido por 6h contínuas (sem curar)
-        if self.care_sick_mistake_timer > get_module(self.module).death_sick_timer:
+        if self.care_sick_mistake_timer > self._death_sick_timer:
             result = True
 
         # 3. Fome OU força vazia por 12h contínuas
-        if self.care_food_mistake_timer > get_module(self.module).death_hunger_timer or self.care_strength_mistake_timer > get_module(self.module).death_strength_timer:
+        if self.care_food_mistake_timer > self._death_hunger_timer or self.care_strength_mistake_timer > self._death_strength_timer:
             result = True
 
         # 4. Stage IV ou V + 5+ erros após fim do tempo de evolução
-        if self.stage in [4, 5] and self.mistakes >= get_module(self.module).death_stage45_mistake:
-            if self.timer > self.time * 60 * FRAME_RATE:
+        if self.stage in [4, 5] and self.mistakes >= self._death_stage45_mistake:
+            if self.timer > self.time * MINUTE_TICKS:
                 result = True
 
         # 5. Stage VI ou VI+ + 5+ erros após 48h
-        if self.stage >= 6 and self.mistakes >= get_module(self.module).death_stage67_mistake:
-            if self.age_timer >= 48 * 60 * 60 * FRAME_RATE:
+        if self.stage >= 6 and self.mistakes >= self._death_stage67_mistake:
+            if self.age_timer >= AGE_48H_TICKS:
                 result = True
 
-        if get_module(self.module).death_starvation_count > 0 and self.starvation_counter > get_module(self.module).death_starvation_count:
+        if self._death_starvation_count > 0 and self.starvation_counter > self._death_starvation_count:
             result = True
 
-        if self.mistakes >= get_module(self.module).death_care_mistake:
+        if self.mistakes >= self._death_care_mistake:
             result = True
 
-        if result and get_module(self.module).death_save_by_b_press:
+        if result and self._death_save_by_b_press:
             if self.death_save_counter == -1:
                 self.death_save_counter = 100
                 return False
@@ -388,7 +519,7 @@ class GamePet:
             else:
                 self.death_save_counter = -1
 
-        if result and get_module(self.module).death_save_by_shake:
+        if result and self._death_save_by_shake:
             if self.shake_counter == -1:
                 self.shake_counter = 50
                 return False
@@ -405,10 +536,9 @@ class GamePet:
             self.set_state("dead")
             runtime_globals.game_sound.play("death")
 
-            # 🔹 Load dead frame with sprite_load()
-            dead_sprite = sprite_load(DEAD_FRAME_PATH, size=(PET_WIDTH, PET_HEIGHT))
-            runtime_globals.pet_sprites[self][0] = dead_sprite
-            runtime_globals.pet_sprites[self][1] = dead_sprite
+            dead_sprite = get_dead_frame()
+            self._sprites[0] = dead_sprite
+            self._sprites[1] = dead_sprite
 
             self.timer = 0
 
@@ -417,6 +547,9 @@ class GamePet:
             if self in game_globals.pet_list:
                 game_globals.pet_list.remove(self)
                 del runtime_globals.pet_sprites[self]
+                self._sprites = []
+                runtime_globals.pet_sprites_scaled.pop((self, PET_ICON_SIZE), None)
+                runtime_globals.pet_sprites_flipped.pop(self, None)
 
             self.set_traited_egg()
 
@@ -430,7 +563,7 @@ class GamePet:
         Handles feeding logic for different food types.
         Returns True if the pet accepted the food, False otherwise.
         """
-        module = get_module(self.module)
+        module = self._module
 
         # Can't eat if sleeping and module doesn't allow it
         if not module.can_eat_sleeping and self.state == "nap":
@@ -451,7 +584,7 @@ class GamePet:
                     self.weight += module.meat_weight_gain
                 self.care_food_mistake_timer = 0
                 accepted = True
-                runtime_globals.game_console.log(f"{self.name} ate food (hunger). Hunger {self.hunger}")
+                _log("%s ate food (hunger). Hunger %s", self.name, self.hunger)
         elif food_type == "strength":
             self.set_state("eat")
             self.strength = min(4, self.strength + amount)
@@ -462,13 +595,13 @@ class GamePet:
                 self.dp += module.protein_dp_gain
             self.care_strength_mistake_timer = 0
             accepted = True
-            runtime_globals.game_console.log(f"{self.name} ate food (strength). Strength {self.strength}")
+            _log("%s ate food (strength). Strength %s", self.name, self.strength)
         else:
             # For other food types, only accept if pet can battle
             if self.can_battle():
                 self.set_state("eat")
                 accepted = True
-                runtime_globals.game_console.log(f"{self.name} ate food ({food_type}).")
+                _log("%s ate food (%s).", self.name, food_type)
             else:
                 self.set_state("nope")
 
@@ -481,63 +614,48 @@ class GamePet:
         self.set_state("sick")
 
     def update_evolution(self):
-        if self.stage > 5 or (self.timer / (FRAME_RATE * 60)) < self.time or self.need_care():
+        if self.stage > 5 or self.timer < self.time * MINUTE_TICKS or self.need_care():
             return
         
-        for evo in self.evolve:
-            def in_range(val, r): return r[0] <= val <= r[1]
-            if (
-                ("jogress" in evo) or ("item" in evo) or
-                ("mistakes" in evo and not in_range(self.mistakes, evo["mistakes"])) or
-                ("condition_hearts" in evo and not in_range(self.condition_hearts, evo["condition_hearts"])) or
-                ("training" in evo and not in_range(self.effort // 4, evo["training"])) or
-                ("overfeed" in evo and not in_range(self.overfeed, evo["overfeed"])) or
-                #("special_encounter" in evo and not self.special_encounter) or
-                ("level" in evo and not in_range(self.level, evo["level"])) or
-                ("stage-5" in evo and not in_range(self.enemy_kills[5], evo["stage-5"])) or
-                ("stage-6" in evo and not in_range(self.enemy_kills[6], evo["stage-6"])) or
-                ("stage-7" in evo and not in_range(self.enemy_kills[7], evo["stage-7"])) or
-                ("stage-8" in evo and not in_range(self.enemy_kills[8], evo["stage-8"])) or
-                ("stage-9" in evo and not in_range(self.enemy_kills[9], evo["stage-9"])) or
-                ("sleep_disturbances" in evo and not in_range(self.sleep_disturbances, evo["sleep_disturbances"])) or
-                ("battles" in evo and not in_range(self.battles, evo["battles"])) or
-                ("win_ratio" in evo and self.battles and not in_range((self.win * 100) // self.battles, evo["win_ratio"]))
-            ):
-                continue
+        # Regenerate only when the evolve list is replaced (evolution, or the boot scene refreshing it)
+        compiled = self.__dict__.get("_compiled_evos")
+        if compiled is None or compiled[0] is not self.evolve:
+            compiled = self._compiled_evos = (self.evolve, compile_evolutions(self.evolve))
 
+        for evo in compiled[1](self):
             if self.stage > 0:
-                module = get_module(self.module)
+                module = self._module
                 pet_data = module.get_monster(evo["to"], self.version)
 
                 if pet_data.get("special", False):
                     special_key = pet_data.get("special_key")
                     if special_key and not is_unlocked(self.module, "evolutions", special_key):
-                        runtime_globals.game_console.log(f"{self.name} cannot evolve into {evo['to']}—special evolution {special_key} is locked.")
+                        _log("%s cannot evolve into %s—special evolution %s is locked.", self.name, evo['to'], special_key)
                         continue  # Skip this evolution
                     else:
-                        runtime_globals.game_console.log("Special evolution check pass")
+                        _log("Special evolution check pass")
 
             # Unlock evolution if present in module unlocks (new format)
-            module = get_module(self.module)
+            module = self._module
             unlocks = getattr(module, "unlocks", [])
             for unlock in unlocks:
                 if unlock.get("type") == "evolution" and "to" in unlock:
                     if evo["to"] in unlock["to"]:
                         unlock_item(self.module, "evolution", unlock["name"])
 
-            if self.stage == 0 and self.shake_counter >= 99 and get_module(self.module).enable_shaken_egg:
+            if self.stage == 0 and self.shake_counter >= 99 and self._module.enable_shaken_egg:
                 self.shook = True
                 
             self.evolve_to(evo["to"], evo.get("version", self.version))
             break
 
     def update_needs(self):
-        if self.timer % (self.hunger_loss  * 60 * FRAME_RATE) == 0 and self.overfeed_timer == 0:
+        if self.timer % (self.hunger_loss * MINUTE_TICKS) == 0 and self.overfeed_timer == 0:
             if self.hunger > 0:
                 self.hunger -= 1
             else:
                 self.starvation_counter += 1
-        if self.timer % (self.strength_loss * 60 * FRAME_RATE) == 0 and self.strength > 0:
+        if self.timer % (self.strength_loss * MINUTE_TICKS) == 0 and self.strength > 0:
             if self.strength > 4:
                 self.strength = 4
             else:
@@ -546,35 +664,36 @@ class GamePet:
             self.overfeed_timer -= 1
 
     def update_pooping(self):
-        if self.stage <= 0 or (self.timer / (FRAME_RATE * 60)) < 1: return
+        if self.stage <= 0 or self.timer < MINUTE_TICKS: return
         if len(game_globals.poop_list) >= (len(game_globals.pet_list) * 8) and self.stage >= 2:
             if self.poop_count_flag == 0:
                 self.poop_count_flag = 1
                 self.set_sick()
-                runtime_globals.game_console.log(f"[!] Care sick of poop ({len(game_globals.poop_list)})! Injuries: {self.injuries}")
+                _log("[!] Care sick of poop (%d)! Injuries: %s", len(game_globals.poop_list), self.injuries)
         else:
             self.poop_count_flag = 0
             
         depletion_rate = 1
-        if self.stage >= 6 and self.age_timer >= 48 * 60 * 60 * FRAME_RATE:
+        if self.stage >= 6 and self.age_timer >= AGE_48H_TICKS:
             depletion_rate = 2  # Accelerate depletion after 48 hours
 
-        if self.timer % (self.poop_timer * 60 * FRAME_RATE // depletion_rate) == 0:
+        if self.timer % (self.poop_timer * MINUTE_TICKS // depletion_rate) == 0:
             self.set_state("pooping")
 
     def update_care_mistakes(self):
+        module = self._module
         sound_alert = False
         #hunger call
         if self.hunger == 0:
             self.care_food_mistake_timer += 1
-            if self.care_food_mistake_timer == get_module(self.module).meat_care_mistake_time:
+            if self.care_food_mistake_timer == module.meat_care_mistake_time:
                 self.add_care_mistake("hunger")
                 sound_alert = True
         
         #strength call
         if self.strength == 0:
             self.care_strength_mistake_timer += 1
-            if self.care_strength_mistake_timer == get_module(self.module).protein_care_mistake_time:
+            if self.care_strength_mistake_timer == module.protein_care_mistake_time:
                 self.add_care_mistake("strength")
                 sound_alert = True
         
@@ -587,7 +706,7 @@ class GamePet:
         #sleep call
         if self.should_sleep():
             self.care_sleep_mistake_timer += 1
-            if self.care_sleep_mistake_timer >= get_module(self.module).sleep_care_mistake_timer:
+            if self.care_sleep_mistake_timer >= module.sleep_care_mistake_timer:
                 self.add_care_mistake("sleep")
                 sound_alert = True
                 self.care_sleep_mistake_timer = 0
@@ -600,10 +719,10 @@ class GamePet:
         if self.use_condition_hearts:
             if self.condition_hearts_max > 0:
                 self.condition_hearts_max -= 1
-                runtime_globals.game_console.log(f"[!] Care mistake ({mistake_type})! Condition hearts left: {self.condition_hearts_max}")
+                _log("[!] Care mistake (%s)! Condition hearts left: %s", mistake_type, self.condition_hearts_max)
         else:
             self.mistakes += 1
-            runtime_globals.game_console.log(f"[!] Care mistake ({mistake_type})! Total: {self.mistakes}")
+            _log("[!] Care mistake (%s)! Total: %s", mistake_type, self.mistakes)
 
     def need_care(self):
         return self.stage != 0 and self.state not in ("dead","nap") and (self.hunger == 0 or self.strength == 0 or self.sick > 0 or self.should_sleep()) 
@@ -611,32 +730,33 @@ class GamePet:
     def call_sign(self):
         if self.stage == 0 or self.state in ("dead","nap"):
             return False
-        if self.hunger == 0 and self.care_food_mistake_timer < get_module(self.module).meat_care_mistake_time:
+        module = self._module
+        if self.hunger == 0 and self.care_food_mistake_timer < module.meat_care_mistake_time:
             return True
-        elif self.strength == 0 and self.care_strength_mistake_timer < get_module(self.module).protein_care_mistake_time:
+        elif self.strength == 0 and self.care_strength_mistake_timer < module.protein_care_mistake_time:
             return True
-        elif self.should_sleep() and self.care_sleep_mistake_timer < get_module(self.module).sleep_care_mistake_timer:
+        elif self.should_sleep() and self.care_sleep_mistake_timer < module.sleep_care_mistake_timer:
             return True
         return False
 
     def set_traited_egg(self):
-        ruleset = get_module(self.module).ruleset
+        ruleset = self._module.ruleset
 
         if ruleset == "dmc":
             if self.stage in [6, 7] and random.randint(0, 10) <= 3:
                 key = f"{self.module}@{self.version}"
                 if key not in game_globals.traited:
                     game_globals.traited.append(key)
-                    runtime_globals.game_console.log(f"Traited Egg granted for {self.name}!")
+                    _log("Traited Egg granted for %s!", self.name)
         elif ruleset == "penc":
             win_ratio = (self.win * 100) // self.battles if self.battles > 0 else 0
 
-            if self.stage >= 6 and self.age_timer >= 48 * 60 * 60 * FRAME_RATE:
+            if self.stage >= 6 and self.age_timer >= AGE_48H_TICKS:
                 if win_ratio >= 60:
                     key = f"{self.module}@{self.version}"
                     if key not in game_globals.traited:
                         game_globals.traited.append(key)
-                        runtime_globals.game_console.log(f"Traited Egg granted for {self.name}!")
+                        _log("Traited Egg granted for %s!", self.name)
         elif ruleset == "dmx":
             trait = False
             if self.timer > 5184000: #48 hours
@@ -649,7 +769,7 @@ class GamePet:
                 key = f"{self.module}@{self.version}"
                 if key not in game_globals.traited:
                     game_globals.traited.append(key)
-                    runtime_globals.game_console.log(f"Traited Egg granted for {self.name}!")
+                    _log("Traited Egg granted for %s!", self.name)
 
 
     def can_battle(self):
@@ -659,11 +779,11 @@ class GamePet:
         return self.stage > 1 and self.state != "dead" and self.atk_main > 0
 
     def set_back_to_sleep(self):
-        self.back_to_sleep = get_module(self.module).back_to_sleep_time
+        self.back_to_sleep = self._module.back_to_sleep_time
 
     def check_disturbed_sleep(self):
         if self.state == "nap":
-            runtime_globals.game_console.log(f"[DEBUG] Sleep disturbance {self.sleep_disturbances}")
+            _log("[DEBUG] Sleep disturbance %s", self.sleep_disturbances)
             self.set_state("idle")
             self.sleep_disturbances += 1
             self.disturbance_penalty += 2
@@ -685,7 +805,7 @@ class GamePet:
         return hp
     
     def get_power(self, bonus = 0):
-        ruleset = get_module(self.module).ruleset
+        ruleset = self._module.ruleset
         power = self.power + bonus
 
         if ruleset == "dmc":
@@ -740,17 +860,8 @@ class GamePet:
             return power + total_bonus
         elif ruleset == "dmx":
             if self.effort >= 16:
-                if self.version > 4:
-                    power += 16
-                else:
-                    power += 15
-            if self.level >= 3:
-                power += 10
-            if self.level >= 6:
-                power += 10
-            if self.level >= 9:
-                power += 10
-            return power
+                power += 16 if self.version > 4 else 15
+            return power + _DMX_LEVEL_BONUS[min(self.level, 9)]
 
     def get_attack(self):
         attack = ATK_LEVEL[self.stage]
@@ -762,17 +873,18 @@ class GamePet:
         return attack
     
     def finish_training(self, won = False):
+        module = self._module
         if won:
             self.set_state("happy2")
-            self.effort += get_module(self.module).training_effort_gain
+            self.effort += module.training_effort_gain
             if self.disturbance_penalty > 2:
                 self.disturbance_penalty -= 2
         else:
             self.set_state("angry")
 
-        self.strength += get_module(self.module).training_strengh_gain
+        self.strength += module.training_strengh_gain
 
-        weight_loss = get_module(self.module).training_weight_win if won else get_module(self.module).training_weight_lose
+        weight_loss = module.training_weight_win if won else module.training_weight_lose
         self.weight = max(self.min_weight, self.weight - weight_loss)
 
     def finish_versus(self, won=False):
@@ -784,6 +896,7 @@ class GamePet:
             self.totalWin += 1
 
     def finish_battle(self, won, enemy, area):
+        module = self._module
         self.battles += 1
         self.dp -= 1
         self.totalBattles += 1
@@ -791,112 +904,137 @@ class GamePet:
             self.set_state("happy3")
             self.win += 1
             self.totalWin += 1
-            sick_chance = get_module(self.module).battle_base_sick_chance_win
+            sick_chance = module.battle_base_sick_chance_win
 
-            if not hasattr(self, 'area'):
-                self.area = 0
-                
             if self.area < area:
                 self.area = area
-                runtime_globals.game_console.log(f"[DEBUG] {self.name} area increased to {self.area} (previous: {self.area})")
-
-            if not hasattr(self, 'enemy_kills'):
-                self.enemy_kills = [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]
+                _log("[DEBUG] %s area increased to %s (previous: %s)", self.name, self.area, self.area)
 
             self.enemy_kills[enemy.stage] += 1
         else:
-            sick_chance = get_module(self.module).battle_base_sick_chance_lose
-            if self.protein_overdose > get_module(self.module).protein_overdose_max:
-                self.protein_overdose = get_module(self.module).protein_overdose_max
+            sick_chance = module.battle_base_sick_chance_lose
+            if self.protein_overdose > module.protein_overdose_max:
+                self.protein_overdose = module.protein_overdose_max
             sick_chance += self.protein_overdose * 10
 
-            if self.disturbance_penalty > get_module(self.module).disturbance_penalty_max:
-                self.disturbance_penalty = get_module(self.module).disturbance_penalty_max
+            if self.disturbance_penalty > module.disturbance_penalty_max:
+                self.disturbance_penalty = module.disturbance_penalty_max
 
             sick_chance += self.disturbance_penalty
 
-        sick_chance = max(0.05, min(sick_chance / 100, 0.5))
-        
-        if random.random() < sick_chance:
+        # Clamp to 5%-50%
+        sick_chance /= 100
+        if sick_chance < 0.05:
+            sick_chance = 0.05
+        elif sick_chance > 0.5:
+            sick_chance = 0.5
+
+        if _random() < sick_chance:
             self.set_sick()
 
     def add_experience(self, xp):
+        max_level = MAX_LEVEL[self.stage]
+        level = self.level
         self.experience += xp
-        if self.level == MAX_LEVEL[self.stage]:
+        if level == max_level:
             self.experience = 0
-        if self.experience >= EXPERIENCE_LEVEL[self.level+1]:
-            self.experience -= EXPERIENCE_LEVEL[self.level+1]
-            self.level += 1
+        next_threshold = EXPERIENCE_LEVEL[level + 1]
+        if self.experience >= next_threshold:
+            self.experience -= next_threshold
+            level = self.level = level + 1
             #runtime_globals.game_message.add(f"Level UP!", (self.x + (PET_WIDTH // 2), self.y), FONT_COLOR_GREEN)
-            if self.level == MAX_LEVEL[self.stage]:
+            if level == max_level:
                 self.experience = 0
 
-    def should_sleep(self):
-        if not self.sleeps or not self.wakes:
-            return False
+    def update_sleep_schedule(self):
+        """
+        Parses sleeps/wakes into the minute-of-day values read by should_sleep and check_wake_up.
+        Must be called whenever either string changes. _wake_mins is parsed on its own, since a
+        sleeping pet wakes at that time even without a valid sleep time; _sleep_enabled needs both.
+        """
+        self._sleep_enabled = False
+        self._sleep_mins = self._wake_mins = None
+        if not self.wakes:
+            return
 
         try:
-            now_time = datetime.now().time()
-
-            # Cache parsing whenever sleeps/wakes change
-            if not hasattr(self, '_cached_sleep_time') or self._last_sleeps != self.sleeps or self._last_wakes != self.wakes:
-                self._cached_sleep_time = datetime.strptime(self.sleeps.strip(), "%H:%M").time()
-                self._cached_wake_time = datetime.strptime(self.wakes.strip(), "%H:%M").time()
-                self._last_sleeps = self.sleeps
-                self._last_wakes = self.wakes
-
-            sleep_time = self._cached_sleep_time
-            wake_time = self._cached_wake_time
-
-            if sleep_time < wake_time:
-                return sleep_time <= now_time < wake_time
-            else:
-                return now_time >= sleep_time or now_time < wake_time
-
+            wake_time = datetime.strptime(self.wakes.strip(), "%H:%M")
+            self._wake_mins = wake_time.hour * 60 + wake_time.minute
+            if not self.sleeps:
+                return
+            sleep_time = datetime.strptime(self.sleeps.strip(), "%H:%M")
         except Exception as e:
-            runtime_globals.game_console.log(f"[!] Error parsing sleep range: {e}")
-            return False
+            _log("[!] Error parsing sleep range: %s", e)
+            return
+        self._sleep_mins = sleep_time.hour * 60 + sleep_time.minute
+        self._sleep_enabled = True
 
+    def should_sleep(self):
+        if not self._sleep_enabled:
+            return False
 
-    def check_wake_up(self):
         now = datetime.now()
+        now_mins = now.hour * 60 + now.minute
+        sleep_mins = self._sleep_mins
+        wake_mins = self._wake_mins
 
-        if not hasattr(self, 'sleep_start_time'):
-            return
+        if sleep_mins < wake_mins:
+            return sleep_mins <= now_mins < wake_mins
+        return now_mins >= sleep_mins or now_mins < wake_mins
 
-        try:
-            # Cache parsing if sleeps/wakes change
-            if not hasattr(self, '_cached_wake_time') or self._last_wakes != self.wakes:
-                self._cached_wake_time = datetime.strptime(self.wakes.strip(), "%H:%M").time()
-                self._last_wakes = self.wakes
 
-            wake_time = self._cached_wake_time
+    def check_wake_up(self):
+        wake_mins = self._wake_mins
+        if self.sleep_start_time is None or wake_mins is None:
+            return
 
-            # Wake up if it's the wake time exactly (match hour and minute)
-            if now.hour == wake_time.hour and now.minute == wake_time.minute:
-                slept_seconds = (now - self.sleep_start_time).total_seconds()
-                slept_hours = int(slept_seconds // 3600)
+        # Wake up if it's the wake time exactly (match hour and minute); a datetime is only
+        # built once the minute matches, for the slept-hours math
+        local = time.localtime()
+        if local.tm_hour * 60 + local.tm_min != wake_mins:
+            return
 
-                if slept_hours >= SLEEP_RECOVERY_HOURS:
-                    self.dp = self.energy
-                    runtime_globals.game_console.log(f"{self.name} slept {slept_hours}h and recovered DP!")
+        slept_seconds = (datetime.now() - self.sleep_start_time).total_seconds()
+        slept_hours = int(slept_seconds // 3600)
 
-                self.set_state("idle")
-                runtime_globals.game_console.log(f"{self.name} woke up naturally at {wake_time.strftime('%H:%M')}")
+        if slept_hours >= SLEEP_RECOVERY_HOURS:
+            self.dp = self.energy
+            _log("%s slept %sh and recovered DP!", self.name, slept_hours)
 
-        except Exception as e:
-            runtime_globals.game_console.log(f"[!] Error parsing wake time: {e}")
+        self.set_state("idle")
+        _log("%s woke up naturally at %02d:%02d", self.name, *divmod(wake_mins, 60))
 
     def __getstate__(self):
         state = self.__dict__.copy()
         state.pop("frames", None)
+        # Module object and copied rules are runtime-only; bind_module() restores them on load
+        state.pop("_module", None)
+        state.pop("_compiled_evos", None)
+        state.pop("_sprites", None)
+        state.pop("_sleep_enabled", None)
+        state.pop("_sleep_mins", None)
+        state.pop("_wake_mins", None)
+        for name in _DEATH_RULES:
+            state.pop("_" + name, None)
         return state
     
     def __setstate__(self, state):
         self.__dict__.update(state)
+        # Older saves may predate these fields
+        self.area = getattr(self, "area", 0)
+        self.sleep_start_time = getattr(self, "sleep_start_time", None)
+        # enemy_kills used to be saved as a plain list
+        enemy_kills = getattr(self, "enemy_kills", None)
+        if enemy_kills is None:
+            self.enemy_kills = array("I", [0] * 11)
+        elif not isinstance(enemy_kills, array):
+            self.enemy_kills = array("I", enemy_kills)
+        # Saves from before update_sleep_schedule carry its old lazy-parse bookkeeping
+        for name in ("_last_sleeps", "_last_wakes", "_cached_sleep_time", "_cached_wake_time"):
+            self.__dict__.pop(name, None)
+        self.update_sleep_schedule()
+        self.bind_module()
         self.load_sprite()
         if self.state == "dead":
-            runtime_globals.pet_sprites[self][0] = pygame.image.load(DEAD_FRAME_PATH).convert_alpha()
-            runtime_globals.pet_sprites[self][0] = pygame.transform.scale(runtime_globals.pet_sprites[self][0], (PET_WIDTH, PET_HEIGHT))
-            runtime_globals.pet_sprites[self][1] = runtime_globals.pet_sprites[self][0]
+            self._sprites[0] = self._sprites[1] = get_dead_frame()
 
@@ -31,7 +31,10 @@ selected_pets = []
 misc_sprites = {}
 battle_enemies = {}
 pet_sprites = {}
+pet_sprites_scaled = {}
+pet_sprites_flipped = {}
 evolution_data = []
+unlocks_version = 0  # Bumped by utils_unlocks.unlock_item whenever something new is unlocked
 evolution_pet = None
 last_headtohead_pattern = random.randint(0, 5)
 
@@ -1,3 +1,4 @@
+import functools
 import hashlib
 import os
 import pygame
@@ -7,6 +8,10 @@ from core import game_console, game_globals, runtime_globals
 
 shadow_cache = {}
 
+SHADOW_OFFSET = (2, 2)
+
+_HAS_FBLITS = hasattr(pygame.Surface, "fblits")
+
 def get_surface_hash(surface):
     """Generate a hash of the surface’s pixel data to uniquely identify it."""
     return hashlib.md5(pygame.image.tostring(surface, "RGBA")).hexdigest()
@@ -19,7 +24,7 @@ def get_shadow(sprite, shadow_color=(0, 0, 0, 100)):
         shadow_cache[key] = shadow
     return shadow_cache[key]
 
-def blit_with_shadow(surface, sprite, pos, offset=(2, 2)):
+def blit_with_shadow(surface, sprite, pos, offset=SHADOW_OFFSET):
     """
     Blits a sprite with a shadow effect and logs the number of calls per second.
     """
@@ -41,9 +46,49 @@ def blit_with_shadow(surface, sprite, pos, offset=(2, 2)):
     surface.blit(shadow, (pos[0] + offset[0], pos[1] + offset[1]))
     surface.blit(sprite, pos)
 
+def bake_shadow(sprite, offset=SHADOW_OFFSET, shadow_color=(0, 0, 0, 100)):
+    """
+    Returns a new surface holding the sprite with its shadow already composited,
+    so it can be drawn with a single blit instead of blit_with_shadow's two.
+    """
+    width, height = sprite.get_size()
+    baked = pygame.Surface((width + offset[0], height + offset[1]), pygame.SRCALPHA)
+    shadow = sprite.copy()
+    shadow.fill(shadow_color, special_flags=pygame.BLEND_RGBA_MULT)
+    baked.blit(shadow, offset)
+    baked.blit(sprite, (0, 0))
+    return baked
+
+@functools.lru_cache(maxsize=512)
+def render_text(font, text, color):
+    """
+    Renders antialiased text, memoized per (font, text, color).
+    Fonts from get_font are shared, so hits carry across windows and scenes.
+    """
+    return font.render(text, True, color)
+
+@functools.lru_cache(maxsize=512)
+def render_shadowed(font, text, color):
+    """
+    Renders text with its shadow baked in. Results are memoized per (font, text, color).
+    """
+    return bake_shadow(render_text(font, text, color))
+
+def blit_batch(surface, blits):
+    """
+    Blits a sequence of (sprite, pos) pairs in a single call.
+    Uses Surface.fblits when available (pygame-ce), falling back to Surface.blits.
+    """
+    if _HAS_FBLITS:
+        surface.fblits(blits)
+    else:
+        surface.blits(blits, False)
+
+@functools.lru_cache(maxsize=None)
 def get_font(size=24):
     return pygame.font.Font("resources/vpet_font.TTF", size)
 
+@functools.lru_cache(maxsize=None)
 def get_font_alt(size=24):
     return pygame.font.Font("resources/vpet_font_alt.ttf", size)
 
@@ -34,6 +34,7 @@ def unlock_item(module: str, unlock_type: str, name: str, label: str = None):
         if entry_label:
             unlock_entry["label"] = entry_label
         game_globals.unlocks[module].append(unlock_entry)
+        runtime_globals.unlocks_version += 1
         runtime_globals.game_message.add_slide(f"{entry_label} unlocked!", (255, 255, 0), 56 * UI_SCALE, FONT_SIZE_SMALL)
 
 def is_unlocked(module: str, unlock_type: str, name: str) -> bool:
@@ -43,6 +44,13 @@ def is_unlocked(module: str, unlock_type: str, name: str) -> bool:
     ensure_module_key(module)
     return any(isinstance(u, dict) and u.get("type") == unlock_type and u.get("name") == name for u in game_globals.unlocks[module])
 
+def get_unlocked_keys(module: str) -> set:
+    """
+    Returns the (type, name) pairs unlocked for a module, for checking many items at once.
+    """
+    ensure_module_key(module)
+    return {(u.get("type"), u.get("name")) for u in game_globals.unlocks[module] if isinstance(u, dict)}
+
 def get_unlocked_backgrounds(module: str, module_backgrounds: list = None) -> list[dict]:
     """
     Returns list of unlocked background dicts (with name and label) for a module.
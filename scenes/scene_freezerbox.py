@@ -129,7 +129,13 @@ class SceneFreezerBox:
             self.handle_freezer_input(input_action)
 
     def clean_unused_pet_sprites(self):
+        # Pets share their frame list with pet_sprites, so drop it on the frozen ones as well
+        for pet in runtime_globals.pet_sprites:
+            if pet not in game_globals.pet_list:
+                pet._sprites = []
         runtime_globals.pet_sprites = {}
+        runtime_globals.pet_sprites_scaled = {}
+        runtime_globals.pet_sprites_flipped = {}
         for pet in game_globals.pet_list:
             pet.load_sprite()
 
@@ -232,15 +232,16 @@ class SceneMainGame:
         """
         pet.draw(surface)
 
-        frame_enum = pet.animation_frames[pet.frame_index]
-        frame = runtime_globals.pet_sprites[pet][frame_enum.value]
-
-        if pet.direction == 1:
-            frame = pygame.transform.flip(frame, True, False)
-
-        if pet in selected_pets:
+        outlined = pet in selected_pets
+        highlighted = self.selection_mode == "pet" and index == self.pet_selection_index
+        if outlined or highlighted:
+            # The outline follows the frame pet.draw just used, including its cached mirror
+            frame_key = pet.animation_frames[pet.frame_index].value
+            frame = pet.get_flipped_sprite(frame_key) if pet.direction == 1 else pet.get_sprite(frame_key)
+
+        if outlined:
             draw_pet_outline(surface, frame, pet.x, pet.y, color=FONT_COLOR_BLUE)  # blue outline
-        if self.selection_mode == "pet" and index == self.pet_selection_index:
+        if highlighted:
             draw_pet_outline(surface, frame, pet.x, pet.y, color=FONT_COLOR_YELLOW)  # yellow highlight
 
         if show_hearts:
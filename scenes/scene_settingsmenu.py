@@ -6,7 +6,23 @@ from core import game_globals, runtime_globals
 from core.constants import *
 from core.utils.pygame_utils import blit_with_shadow, get_font, sprite_load_percent
 from core.utils.scene_utils import change_scene
-from core.utils.utils_unlocks import get_unlocked_backgrounds, is_unlocked
+from core.utils.utils_unlocks import get_unlocked_backgrounds, get_unlocked_keys
+
+# Layout constants, computed once at import instead of on every redraw
+TITLE_Y = int(10 * UI_SCALE)
+ROW_HEIGHT = int(40 * UI_SCALE)
+OPTION_X = int(25 * UI_SCALE)
+OPTION_Y = int(60 * UI_SCALE)
+OPTION_ICON_RIGHT = int(20 * UI_SCALE)
+HIGHLIGHT_HEIGHT = int(36 * UI_SCALE)
+# Selection box around row 0 of the options list; rows add ROW_HEIGHT to its y
+OPTION_HIGHLIGHT = (int(15 * UI_SCALE), int(54 * UI_SCALE), SCREEN_WIDTH - int(30 * UI_SCALE), HIGHLIGHT_HEIGHT)
+UNLOCK_HEADER_Y = int(54 * UI_SCALE)
+UNLOCK_LIST_X = int(40 * UI_SCALE)
+UNLOCK_LIST_Y = int(90 * UI_SCALE)
+UNLOCK_HIGHLIGHT_X = int(30 * UI_SCALE)
+UNLOCK_HIGHLIGHT_WIDTH = SCREEN_WIDTH - int(60 * UI_SCALE)
+HIGH_RES_Y = SCREEN_HEIGHT // 2 + int(40 * UI_SCALE)
 
 
 class SceneSettingsMenu:
@@ -14,10 +30,15 @@ class SceneSettingsMenu:
     Scene for navigating game settings, including background selection.
     """
 
+    # module name -> (unlocks_version, module unlocks, unlocked items, their (normal, selected) label surfaces),
+    # shared across visits to the menu
+    _unlocked_cache = {}
+
     def __init__(self) -> None:
         """Initializes the settings menu."""
         self.background = WindowBackground(False)
         self.font = get_font(FONT_SIZE_MEDIUM)
+        self.title_font = get_font(FONT_SIZE_LARGE)
 
         # Main options menu
         self.options = [
@@ -35,20 +56,37 @@ class SceneSettingsMenu:
             "Debug"
         ]
 
-        # Load sprites for visual indicators using the new method and scale
+        # Static text is rendered once; option rows keep a (normal, selected) surface pair
+        self.title_surfaces = {
+            mode: self.title_font.render(title, True, (255, 200, 50))
+            for mode, title in (
+                ("menu", "Settings Menu"),
+                ("settings", "Settings"),
+                ("background", "Select Background"),
+                ("unlockables", "Unlockables"),
+            )
+        }
+        self.option_surfaces = {
+            "menu": self.render_options(self.options),
+            "settings": self.render_options(self.settings_options),
+        }
+        self.high_res_surfaces = {
+            enabled: self.font.render("High-Res: ON" if enabled else "High-Res: OFF", True, (200, 200, 200))
+            for enabled in (False, True)
+        }
+
+        # Load sprites for visual indicators, sharing the On/Off icons between toggles
+        icon_percent = (MENU_ICON_SIZE / SCREEN_HEIGHT) * 100
+        toggle_sprites = {
+            "On": sprite_load_percent("resources/IconOn.png", percent=icon_percent, keep_proportion=True, base_on="height"),
+            "Off": sprite_load_percent("resources/IconOff.png", percent=icon_percent, keep_proportion=True, base_on="height")
+        }
         self.settings_sprites = {
-            "Show Clock": {
-                "On": sprite_load_percent("resources/IconOn.png", percent=(MENU_ICON_SIZE / SCREEN_HEIGHT) * 100, keep_proportion=True, base_on="height"),
-                "Off": sprite_load_percent("resources/IconOff.png", percent=(MENU_ICON_SIZE / SCREEN_HEIGHT) * 100, keep_proportion=True, base_on="height")
-            },
-            "Debug": {
-                "On": sprite_load_percent("resources/IconOn.png", percent=(MENU_ICON_SIZE / SCREEN_HEIGHT) * 100, keep_proportion=True, base_on="height"),
-                "Off": sprite_load_percent("resources/IconOff.png", percent=(MENU_ICON_SIZE / SCREEN_HEIGHT) * 100, keep_proportion=True, base_on="height")
-            },
+            "Show Clock": toggle_sprites,
+            "Debug": toggle_sprites,
             "Sound": {
-                0: sprite_load_percent("resources/Sound0.png", percent=(MENU_ICON_SIZE / SCREEN_HEIGHT) * 100, keep_proportion=True, base_on="height"),
-                1: sprite_load_percent("resources/Sound1.png", percent=(MENU_ICON_SIZE / SCREEN_HEIGHT) * 100, keep_proportion=True, base_on="height"),
-                2: sprite_load_percent("resources/Sound2.png", percent=(MENU_ICON_SIZE / SCREEN_HEIGHT) * 100, keep_proportion=True, base_on="height")
+                level: sprite_load_percent(f"resources/Sound{level}.png", percent=icon_percent, keep_proportion=True, base_on="height")
+                for level in (0, 1, 2)
             }
         }
 
@@ -58,28 +96,53 @@ class SceneSettingsMenu:
 
         self.selected_index = 0
 
-        self.unlocked_backgrounds = []
+        # Unlocked backgrounds as parallel module/name/label columns, plus (module, name) -> first index
+        self.bg_modules = []
+        self.bg_names = []
+        self.bg_labels = []
+        self.bg_indices = {}
         for module in runtime_globals.game_modules.values():
             # Get unlocked backgrounds as dicts with name and label
             for bg in get_unlocked_backgrounds(module.name, getattr(module, "unlocks", [])):
-                self.unlocked_backgrounds.append((module.name, bg["name"], bg.get("label", bg["name"])))
+                self.bg_indices.setdefault((module.name, bg["name"]), len(self.bg_names))
+                self.bg_modules.append(module.name)
+                self.bg_names.append(bg["name"])
+                self.bg_labels.append(bg.get("label", bg["name"]))
         self.current_bg_index = self.get_current_background_index()
         runtime_globals.game_console.log("[SceneSettingsMenu] Settings menu loaded.")
 
+        self._handlers = self.build_handlers()
+
+        # Bumped by invalidate_cache(); draw() rebuilds when it differs from the cached surface's version
+        self._cache_version = 0
+        self._drawn_version = -1
         self._last_cache = None
-        self._last_cache_key = None
+
+    def render_options(self, labels):
+        """Renders each option label in its normal and selected colors."""
+        return [
+            (self.font.render(label, True, FONT_COLOR_DEFAULT), self.font.render(label, True, (255, 255, 0)))
+            for label in labels
+        ]
 
     def load_unlockables(self):
         """Loads unlockable progress for all game modules."""
         self.unlockables_data = []
+        version = runtime_globals.unlocks_version
         for module in runtime_globals.game_modules.values():
             unlocks = getattr(module, "unlocks", [])
-            # Get all unlocked items (any type) for this module
-            unlocked_items = [u for u in unlocks if is_unlocked(module.name, u.get("type", ""), u.get("name", ""))]
+            # Get all unlocked items (any type) for this module, rescanning only after a new unlock
+            cached = self._unlocked_cache.get(module.name)
+            if cached is None or cached[0] != version or cached[1] is not unlocks:
+                unlocked_keys = get_unlocked_keys(module.name)
+                unlocked_items = [u for u in unlocks if (u.get("type", ""), u.get("name", "")) in unlocked_keys]
+                labels = [u.get("label", u.get("name", "???")) for u in unlocked_items]
+                cached = self._unlocked_cache[module.name] = (version, unlocks, unlocked_items, self.render_options(labels))
             self.unlockables_data.append({
                 "name": module.name,
                 "icon": runtime_globals.game_module_flag.get(module.name, None),
-                "unlocked": unlocked_items,
+                "unlocked": cached[2],
+                "rows": cached[3],
                 "all": unlocks
             })
         self.current_unlock_module_index = 0
@@ -89,41 +152,26 @@ class SceneSettingsMenu:
         """Gets index of current background in the unlocked list."""
         if not game_globals.game_background:
             return 0
-        for i, (mod, name, label) in enumerate(self.unlocked_backgrounds):
-            if name == game_globals.game_background and mod == game_globals.background_module_name:
-                return i
-        return 0
+        return self.bg_indices.get((game_globals.background_module_name, game_globals.game_background), 0)
 
     def invalidate_cache(self):
-        self._last_cache = None
-        self._last_cache_key = None
+        self._cache_version += 1
 
     def draw(self, surface: pygame.Surface) -> None:
         """Draws the appropriate menu based on the current mode, using cache for static content."""
-        cache_key = (
-            self.mode,
-            self.selected_index,
-            self.current_bg_index if self.mode == "background" else None,
-            tuple(self.options) if self.mode == "menu" else None,
-            tuple(self.settings_options) if self.mode == "settings" else None,
-            SCREEN_WIDTH,
-            SCREEN_HEIGHT,
-            UI_SCALE
-        )
-        if self._last_cache_key != cache_key or self._last_cache is None:
+        if self._drawn_version != self._cache_version:
             # Redraw and cache
             cached_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
             self.background.draw(cached_surface)
             overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
             overlay.fill((50, 50, 50, 200))  
 
-            title_font = get_font(FONT_SIZE_LARGE)
-            option_font = get_font(FONT_SIZE_MEDIUM)
+            option_font = self.font
 
             if self.mode == "unlockables":
                 blit_with_shadow(cached_surface, overlay, (0, 0))
-                title_surface = title_font.render("Unlockables", True, (255, 200, 50))
-                blit_with_shadow(cached_surface, title_surface, (SCREEN_WIDTH // 2 - title_surface.get_width() // 2, int(10 * UI_SCALE)))
+                title_surface = self.title_surfaces["unlockables"]
+                blit_with_shadow(cached_surface, title_surface, (SCREEN_WIDTH // 2 - title_surface.get_width() // 2, TITLE_Y))
 
                 module_count = len(self.unlockables_data)
                 module_idx = getattr(self, "current_unlock_module_index", 0)
@@ -140,22 +188,20 @@ class SceneSettingsMenu:
                     # Header: Unlocked X of Y
                     header = f"{module_data['name']}: {len(unlocked)} of {len(all_items)} unlocked"
                     header_surface = option_font.render(header, True, (255, 255, 0))
-                    blit_with_shadow(cached_surface, header_surface, (SCREEN_WIDTH // 2 - header_surface.get_width() // 2, int(54 * UI_SCALE)))
+                    blit_with_shadow(cached_surface, header_surface, (SCREEN_WIDTH // 2 - header_surface.get_width() // 2, UNLOCK_HEADER_Y))
 
                     # Show a scrollable list of unlocked item labels
                     visible_start = max(0, item_idx - 2)
-                    visible_items = unlocked[visible_start:visible_start + 5]
-                    start_y = int(90 * UI_SCALE)
-                    for i, item in enumerate(visible_items):
+                    visible_rows = module_data["rows"][visible_start:visible_start + 5]
+                    for i, row_surfaces in enumerate(visible_rows):
                         actual_index = visible_start + i
-                        label = item.get("label", item.get("name", "???"))
-                        color = (255, 255, 0) if actual_index == item_idx else FONT_COLOR_DEFAULT
-                        text_surface = option_font.render(label, True, color)
-                        blit_with_shadow(cached_surface, text_surface, (int(40 * UI_SCALE), start_y + i * int(40 * UI_SCALE)))
+                        text_surface = row_surfaces[actual_index == item_idx]
+                        row_y = UNLOCK_LIST_Y + i * ROW_HEIGHT
+                        blit_with_shadow(cached_surface, text_surface, (UNLOCK_LIST_X, row_y))
                         if actual_index == item_idx:
                             pygame.draw.rect(
                                 cached_surface, (255, 200, 50),
-                                (int(30 * UI_SCALE), start_y + i * int(40 * UI_SCALE), SCREEN_WIDTH - int(60 * UI_SCALE), int(36 * UI_SCALE)), 2
+                                (UNLOCK_HIGHLIGHT_X, row_y, UNLOCK_HIGHLIGHT_WIDTH, HIGHLIGHT_HEIGHT), 2
                             )
 
                 # Show navigation hints
@@ -165,137 +211,153 @@ class SceneSettingsMenu:
 
             elif self.mode == "menu":
                 blit_with_shadow(cached_surface, overlay, (0, 0))
-                title_surface = title_font.render("Settings Menu", True, (255, 200, 50))
+                title_surface = self.title_surfaces["menu"]
                 options_list = self.options
             elif self.mode == "settings":
                 blit_with_shadow(cached_surface, overlay, (0, 0))
-                title_surface = title_font.render("Settings", True, (255, 200, 50))
+                title_surface = self.title_surfaces["settings"]
                 options_list = self.settings_options
             elif self.mode == "background":
-                title_surface = title_font.render("Select Background", True, (255, 200, 50))
+                title_surface = self.title_surfaces["background"]
                 options_list = []  # No list needed for background selection
 
                 # Draw the current background label
-                if self.unlocked_backgrounds:
-                    mod, name, label = self.unlocked_backgrounds[self.current_bg_index]
+                if self.bg_labels:
+                    label = self.bg_labels[self.current_bg_index]
                     bg_surface = option_font.render(label, True, (255, 255, 0))
                     blit_with_shadow(cached_surface, bg_surface, (SCREEN_WIDTH // 2 - bg_surface.get_width() // 2, SCREEN_HEIGHT // 2))
 
                 # Display the high-resolution toggle status
-                high_res_status = "High-Res: ON" if game_globals.background_high_res else "High-Res: OFF"
-                high_res_surface = option_font.render(high_res_status, True, (200, 200, 200))
-                blit_with_shadow(cached_surface, high_res_surface, (SCREEN_WIDTH // 2 - high_res_surface.get_width() // 2, SCREEN_HEIGHT // 2 + int(40 * UI_SCALE)))
+                high_res_surface = self.high_res_surfaces[bool(game_globals.background_high_res)]
+                blit_with_shadow(cached_surface, high_res_surface, (SCREEN_WIDTH // 2 - high_res_surface.get_width() // 2, HIGH_RES_Y))
 
-            blit_with_shadow(cached_surface, title_surface, (SCREEN_WIDTH // 2 - title_surface.get_width() // 2, int(10 * UI_SCALE)))
+            blit_with_shadow(cached_surface, title_surface, (SCREEN_WIDTH // 2 - title_surface.get_width() // 2, TITLE_Y))
 
             if self.mode in ["menu", "settings"]:
+                option_surfaces = self.option_surfaces[self.mode]
+                setting_sprites = self.get_setting_sprites() if self.mode == "settings" else None
                 for i, label in enumerate(options_list):
-                    color = (255, 255, 0) if i == self.selected_index else FONT_COLOR_DEFAULT
-                    text_surface = option_font.render(label, True, color)
-                    blit_with_shadow(cached_surface, text_surface, (int(25 * UI_SCALE), int(60 * UI_SCALE) + i * int(40 * UI_SCALE)))
+                    row_y = OPTION_Y + i * ROW_HEIGHT
+                    text_surface = option_surfaces[i][i == self.selected_index]
+                    blit_with_shadow(cached_surface, text_surface, (OPTION_X, row_y))
 
                     if self.mode == "settings":
-                        sprite = self.get_setting_sprite(label)
+                        sprite = setting_sprites.get(label)
                         if sprite:
-                            cached_surface.blit(sprite, (SCREEN_WIDTH - sprite.get_width() - int(20 * UI_SCALE), int(60 * UI_SCALE) + i * int(40 * UI_SCALE)))
+                            cached_surface.blit(sprite, (SCREEN_WIDTH - sprite.get_width() - OPTION_ICON_RIGHT, row_y))
 
                     if i == self.selected_index:
-                        pygame.draw.rect(cached_surface, (255, 200, 50), (int(15 * UI_SCALE), int(54 * UI_SCALE) + i * int(40 * UI_SCALE), SCREEN_WIDTH - int(30 * UI_SCALE), int(36 * UI_SCALE)), 2)
+                        x, y, width, height = OPTION_HIGHLIGHT
+                        pygame.draw.rect(cached_surface, (255, 200, 50), (x, y + i * ROW_HEIGHT, width, height), 2)
 
             elif self.mode == "background":
-                if self.unlocked_backgrounds:
-                    mod, name, label = self.unlocked_backgrounds[self.current_bg_index]
+                if self.bg_labels:
+                    label = self.bg_labels[self.current_bg_index]
                     # Draw the label instead of the name
                     bg_surface = option_font.render(label, True, (255, 255, 0))
                     blit_with_shadow(cached_surface, bg_surface, (SCREEN_WIDTH // 2 - bg_surface.get_width() // 2, SCREEN_HEIGHT // 2))
 
             self._last_cache = cached_surface
-            self._last_cache_key = cache_key
+            self._drawn_version = self._cache_version
 
         # Blit cached content
         surface.blit(self._last_cache, (0, 0))
 
-    def get_setting_sprite(self, label: str):
-        """Returns the correct sprite for a setting."""
-        if label == "Show Clock":
-            return self.settings_sprites["Show Clock"]["On"] if game_globals.showClock else self.settings_sprites["Show Clock"]["Off"]
-        elif label == "Debug":
-            return self.settings_sprites["Debug"]["On"] if game_globals.debug else self.settings_sprites["Debug"]["Off"]
-        elif label == "Sound":
-            return self.settings_sprites["Sound"].get(game_globals.sound, self.settings_sprites["Sound"][0])
-        return None
+    def get_setting_sprites(self) -> dict:
+        """Returns the indicator sprite for each setting that has one, for the current values."""
+        sprites = self.settings_sprites
+        sound = sprites["Sound"]
+        return {
+            "Show Clock": sprites["Show Clock"]["On" if game_globals.showClock else "Off"],
+            "Debug": sprites["Debug"]["On" if game_globals.debug else "Off"],
+            "Sound": sound.get(game_globals.sound, sound[0]),
+        }
     
     def handle_event(self, input_action) -> None:
         """Handles navigation and updates mode accordingly, invalidating cache as needed."""
         if input_action:
-            if self.mode == "background":
-                if input_action == "START" or input_action == "B":
-                    self.mode = "settings"
-                    runtime_globals.game_sound.play("cancel")
-                    self.invalidate_cache()
-                elif input_action in ("LEFT", "RIGHT"):
-                    runtime_globals.game_sound.play("menu")
-                    self.change_background(increase=(input_action == "RIGHT"))
-                    self.invalidate_cache()
-                elif input_action == "SELECT":
-                    # Toggle high-resolution backgrounds
-                    game_globals.background_high_res = not game_globals.background_high_res
-                    runtime_globals.game_console.log(f"[SceneSettingsMenu] High-Resolution Backgrounds set to {game_globals.background_high_res}")
-                    self.background.load_sprite(False)  # Reload background with updated resolution
-                    runtime_globals.game_sound.play("menu")
-                    self.invalidate_cache()
-                return
-            elif self.mode == "unlockables":
-                module_count = len(self.unlockables_data)
-                module_idx = getattr(self, "current_unlock_module_index", 0)
-                item_idx = getattr(self, "current_unlock_item_index", 0)
-                unlocked = self.unlockables_data[module_idx]["unlocked"]
-
-                if input_action in ["START", "B"]:
-                    runtime_globals.game_sound.play("cancel")
-                    self.mode = "menu"
-                    self.invalidate_cache()
-                elif input_action == "LEFT":
-                    runtime_globals.game_sound.play("menu")
-                    self.current_unlock_module_index = (module_idx - 1) % module_count
-                    self.current_unlock_item_index = 0
-                    self.invalidate_cache()
-                elif input_action == "RIGHT":
-                    runtime_globals.game_sound.play("menu")
-                    self.current_unlock_module_index = (module_idx + 1) % module_count
-                    self.current_unlock_item_index = 0
-                    self.invalidate_cache()
-                elif input_action == "UP":
-                    runtime_globals.game_sound.play("menu")
-                    if unlocked:
-                        self.current_unlock_item_index = (item_idx - 1) % len(unlocked)
-                    self.invalidate_cache()
-                elif input_action == "DOWN":
-                    runtime_globals.game_sound.play("menu")
-                    if unlocked:
-                        self.current_unlock_item_index = (item_idx + 1) % len(unlocked)
-                    self.invalidate_cache()
-            elif input_action == "START" or input_action == "B":
-                runtime_globals.game_sound.play("cancel")
-                self.exit_to_game()
-                self.invalidate_cache()
-            elif input_action == "UP":
-                runtime_globals.game_sound.play("menu")
-                self.selected_index = (self.selected_index - 1) % len(self.settings_options if self.mode == "settings" else self.options)
-                self.invalidate_cache()
-            elif input_action == "DOWN":
-                runtime_globals.game_sound.play("menu")
-                self.selected_index = (self.selected_index + 1) % len(self.settings_options if self.mode == "settings" else self.options)
-                self.invalidate_cache()
-            elif input_action in ("LEFT", "RIGHT"):
-                runtime_globals.game_sound.play("menu")
-                if self.mode == "settings":
-                    self.change_option(increase=(input_action == "RIGHT"))
-                    self.invalidate_cache()
-            elif input_action == "A":
-                self.handle_enter()
+            handler = self._handlers[self.mode].get(input_action)
+            if handler:
+                handler()
                 self.invalidate_cache()
 
+    def build_handlers(self) -> dict:
+        """Builds the mode -> input action -> handler table used by handle_event."""
+        list_handlers = {
+            "START": self.leave_menu,
+            "B": self.leave_menu,
+            "UP": lambda: self.move_selection(-1),
+            "DOWN": lambda: self.move_selection(1),
+            "LEFT": lambda: runtime_globals.game_sound.play("menu"),
+            "RIGHT": lambda: runtime_globals.game_sound.play("menu"),
+            "A": self.handle_enter,
+        }
+        return {
+            "menu": list_handlers,
+            "settings": {
+                **list_handlers,
+                "LEFT": lambda: self.cycle_option(False),
+                "RIGHT": lambda: self.cycle_option(True),
+            },
+            "background": {
+                "START": self.leave_background,
+                "B": self.leave_background,
+                "LEFT": lambda: self.cycle_background(False),
+                "RIGHT": lambda: self.cycle_background(True),
+                "SELECT": self.toggle_high_res,
+            },
+            "unlockables": {
+                "START": self.leave_unlockables,
+                "B": self.leave_unlockables,
+                "LEFT": lambda: self.change_unlock_module(-1),
+                "RIGHT": lambda: self.change_unlock_module(1),
+                "UP": lambda: self.scroll_unlocks(-1),
+                "DOWN": lambda: self.scroll_unlocks(1),
+            },
+        }
+
+    def leave_menu(self) -> None:
+        runtime_globals.game_sound.play("cancel")
+        self.exit_to_game()
+
+    def move_selection(self, step: int) -> None:
+        runtime_globals.game_sound.play("menu")
+        self.selected_index = (self.selected_index + step) % len(self.settings_options if self.mode == "settings" else self.options)
+
+    def cycle_option(self, increase: bool) -> None:
+        runtime_globals.game_sound.play("menu")
+        self.change_option(increase=increase)
+
+    def leave_background(self) -> None:
+        self.mode = "settings"
+        runtime_globals.game_sound.play("cancel")
+
+    def cycle_background(self, increase: bool) -> None:
+        runtime_globals.game_sound.play("menu")
+        self.change_background(increase=increase)
+
+    def toggle_high_res(self) -> None:
+        # Toggle high-resolution backgrounds
+        game_globals.background_high_res = not game_globals.background_high_res
+        runtime_globals.game_console.log(f"[SceneSettingsMenu] High-Resolution Backgrounds set to {game_globals.background_high_res}")
+        self.background.load_sprite(False)  # Reload background with updated resolution
+        runtime_globals.game_sound.play("menu")
+
+    def leave_unlockables(self) -> None:
+        runtime_globals.game_sound.play("cancel")
+        self.mode = "menu"
+
+    def change_unlock_module(self, step: int) -> None:
+        runtime_globals.game_sound.play("menu")
+        self.current_unlock_module_index = (self.current_unlock_module_index + step) % len(self.unlockables_data)
+        self.current_unlock_item_index = 0
+
+    def scroll_unlocks(self, step: int) -> None:
+        runtime_globals.game_sound.play("menu")
+        unlocked = self.unlockables_data[self.current_unlock_module_index]["unlocked"]
+        if unlocked:
+            self.current_unlock_item_index = (self.current_unlock_item_index + step) % len(unlocked)
+
     def handle_enter(self) -> None:
         """Handles selection and transitions between modes."""
         runtime_globals.game_sound.play("menu")
@@ -352,13 +414,15 @@ class SceneSettingsMenu:
 
     def change_background(self, increase: bool) -> None:
         """Changes background index while keeping it cyclic."""
-        if not self.unlocked_backgrounds:
+        if not self.bg_names:
             return  
 
-        self.current_bg_index = (self.current_bg_index + 1) % len(self.unlocked_backgrounds) if increase else (self.current_bg_index - 1) % len(self.unlocked_backgrounds)
+        self.current_bg_index = (self.current_bg_index + (1 if increase else -1)) % len(self.bg_names)
 
-        mod, name, label = self.unlocked_backgrounds[self.current_bg_index]
-        game_globals.game_background = name
+        index = self.current_bg_index
+        mod = self.bg_modules[index]
+        label = self.bg_labels[index]
+        game_globals.game_background = self.bg_names[index]
         game_globals.background_module_name = mod
 
         self.background.load_sprite(False)  # Force reload
@@ -118,7 +118,7 @@ class SceneSleepMenu:
         for pet in pets:
             if pet.state == "nap":
                 slept_hours = 0
-                if hasattr(pet, "sleep_start_time"):
+                if pet.sleep_start_time is not None:
                     slept_hours = (now - pet.sleep_start_time).total_seconds() // 3600
 
                 pet.set_state("idle")